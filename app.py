@@ -6,35 +6,98 @@ Flask web interface for YouTube Audio Processing Pipeline
 from src.warning_suppression import *
 
 import os
+import re
 import sys
 import json
 import uuid
+import queue
 import threading
 import time
+import random
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
-from werkzeug.utils import secure_filename
+from typing import TYPE_CHECKING
+from flask import Flask, Response, render_template, request, jsonify, send_file
 import logging
+import orjson
+
+try:
+    from redis import Redis
+    from rq import Queue, Retry
+    RQ_AVAILABLE = True
+except ImportError:
+    Redis = None
+    Queue = None
+    Retry = None
+    RQ_AVAILABLE = False
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from src.simple_pipeline import SimpleDownloadPipeline
 from src.config import Config
+from src.job_store import JobStore
+from src.egress_pool import EgressPool, DEFAULT_EGRESS, is_bot_detection_error
+
+if TYPE_CHECKING:
+    # Imported lazily in create_pipeline(): yt-dlp and the Google clients are only
+    # needed by job workers, not by the status/result routes
+    from src.simple_pipeline import SimpleDownloadPipeline
+
+# Settings read on every job start, bound once at import
+OUTPUT_DIR = Config.OUTPUT_DIR
+YT_API_KEY = Config.YOUTUBE_API_KEY
+GCP_BUCKET = "dataset_youtube_katube"
 
 app = Flask(__name__)
-import secrets
-app.secret_key = secrets.token_urlsafe(32)
+# Shared by every worker so signed cookies stay valid across processes and restarts
+app.secret_key = os.environ.get("FLASK_SECRET_KEY", "")
+# Fail fast on a missing key or the old env.example placeholder (publicly known)
+if not app.secret_key or app.secret_key == "troque_por_uma_chave_aleatoria":
+    raise RuntimeError(
+        "FLASK_SECRET_KEY is not set or is the env.example placeholder. Generate one with: "
+        "python -c \"import secrets; print(secrets.token_hex(32))\""
+    )
 
-# Global variables for job tracking
-active_jobs = {}
-job_lock = threading.Lock()
+# URL classification patterns (compiled once at import)
+_CHANNEL_RE = re.compile(r"/(?:channel/|c/|user/|@|playlist\?)", re.IGNORECASE)
+_VIDEO_RE = re.compile(r"youtube\.com/watch|youtu\.be/", re.IGNORECASE)
+_VID_RE = re.compile(r"(?:v=|youtu\.be/|/)([A-Za-z0-9_-]{11})")
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Job status storage (Redis when REDIS_URL is set, in-memory otherwise)
+job_store = JobStore(redis_url=Config.REDIS_URL, ttl=Config.JOB_TTL)
+
+# Task queue for background jobs (RQ workers), threads are used otherwise
+download_queue = None
+if Config.USE_TASK_QUEUE:
+    if not RQ_AVAILABLE:
+        logger.warning("⚠️ RQ not available, running jobs in threads. Install with: pip install rq")
+    elif not job_store.is_distributed():
+        logger.warning("⚠️ USE_TASK_QUEUE requires REDIS_URL, running jobs in threads")
+    else:
+        download_queue = Queue(Config.TASK_QUEUE_NAME, connection=Redis.from_url(Config.REDIS_URL))
+        logger.info(f"✅ Background jobs will be queued on RQ queue: {Config.TASK_QUEUE_NAME}")
+
+# Egress proxies with a TTL blacklist for YouTube bot-detection windows
+egress_pool = EgressPool(
+    proxies=Config.YT_PROXIES,
+    faulty_ttl=Config.FAULTY_TTL,
+    redis_client=job_store.redis
+)
+
+# Cap simultaneous yt-dlp jobs per process to stay under YouTube bot detection
+DOWNLOAD_SEM = threading.BoundedSemaphore(Config.YT_CONCURRENCY)
+
+# Fields returned by /status and /jobs (results are only read by /result)
+STATUS_FIELDS = ['job_id', 'url', 'status', 'progress', 'message', 'start_time', 'end_time', 'error']
+
+def _ns_to_iso(ns: int) -> str:
+    """Format epoch nanoseconds as a local ISO 8601 timestamp."""
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
 class JobStatus:
     def __init__(self, job_id: str, url: str):
         self.job_id = job_id
@@ -42,54 +105,201 @@ class JobStatus:
         self.status = "waiting"  # waiting, downloading, segmenting, diarizing, separating, completed, failed
         self.progress = 0  # 0-100
         self.message = "Iniciando processamento..."
-        self.start_time = datetime.now()
-        self.end_time = None
+        # Timestamps kept as epoch nanoseconds, ISO strings formatted once for presentation
+        self.start_ns = time.time_ns()
+        self.start_time_iso = _ns_to_iso(self.start_ns)
+        self.end_ns = None
+        self.end_time_iso = None
         self.results = None
         self.error = None
+        self._last_update = 0.0
+    
+    @classmethod
+    def load(cls, job_id: str):
+        """Load a job from the job store, or None if it does not exist."""
+        fields = job_store.load(job_id)
+        if not fields:
+            return None
+        
+        job = cls(job_id, fields.get('url', ''))
+        job.status = fields.get('status', job.status)
+        job.progress = int(fields.get('progress') or 0)
+        job.message = fields.get('message', '')
+        if fields.get('start_ns'):
+            job.start_ns = int(fields['start_ns'])
+            job.start_time_iso = fields.get('start_time', '')
+        if fields.get('end_ns'):
+            job.end_ns = int(fields['end_ns'])
+            job.end_time_iso = fields.get('end_time', '')
+        job.results = json.loads(fields['results']) if fields.get('results') else None
+        job.error = fields.get('error') or None
+        return job
+    
+    def to_fields(self) -> dict:
+        """Flatten job state into string fields for the job store."""
+        return {
+            'job_id': self.job_id,
+            'url': self.url,
+            'status': self.status,
+            'progress': str(self.progress),
+            'message': self.message,
+            'start_ns': str(self.start_ns),
+            'start_time': self.start_time_iso,
+            'end_ns': str(self.end_ns) if self.end_ns else '',
+            'end_time': self.end_time_iso or '',
+            'results': json.dumps(self.results, ensure_ascii=False, default=str) if self.results is not None else '',
+            'error': self.error or ''
+        }
+    
+    @property
+    def processing_time(self) -> float:
+        """Elapsed seconds between start and end, 0 while still running."""
+        return (self.end_ns - self.start_ns) / 1e9 if self.end_ns else 0
+    
+    def save(self):
+        job_store.save(self.job_id, self.to_fields())
         
     def update(self, status: str, progress: int, message: str):
         self.status = status
         self.progress = progress
         self.message = message
-        logger.info(f"Job {self.job_id}: {status} - {progress}% - {message}")
+        job_store.save(self.job_id, {
+            'status': status,
+            'progress': str(progress),
+            'message': message
+        })
+        logger.info("Job %s: %s - %d%% - %s", self.job_id, status, progress, message)
+    
+    def update_throttled(self, status: str, progress: int, message: str, force: bool = False):
+        """Coalesce frequent progress updates, writing at most every PROGRESS_UPDATE_INTERVAL seconds."""
+        now = time.monotonic()
+        if force or progress in (0, 100) or now - self._last_update >= Config.PROGRESS_UPDATE_INTERVAL:
+            self._last_update = now
+            self.update(status, progress, message)
         
     def complete(self, results: dict):
         self.status = "completed"
         self.progress = 100
         self.message = "Processamento concluído com sucesso!"
-        self.end_time = datetime.now()
+        self.end_ns = time.time_ns()
+        self.end_time_iso = _ns_to_iso(self.end_ns)
         self.results = results
+        self.save()
         
     def fail(self, error: str):
         self.status = "failed"
         self.progress = 0
         self.message = f"Erro: {error}"
-        self.end_time = datetime.now()
+        self.end_ns = time.time_ns()
+        self.end_time_iso = _ns_to_iso(self.end_ns)
         self.error = error
+        self.save()
+
+def run_pipeline(pipeline: 'SimpleDownloadPipeline', **kwargs) -> dict:
+    """Run pipeline.process_url under the download semaphore, after a random pre-download sleep."""
+    # Sleep before taking a slot, an idle sleep must not hold one of the YT_CONCURRENCY permits
+    if Config.YT_PRE_DOWNLOAD_SLEEP > 0:
+        time.sleep(random.uniform(0, Config.YT_PRE_DOWNLOAD_SLEEP))
+    with DOWNLOAD_SEM:
+        return pipeline.process_url(**kwargs)
+
+def create_pipeline(proxy: str) -> 'SimpleDownloadPipeline':
+    """Create a download pipeline that goes out through the given egress."""
+    from src.simple_pipeline import SimpleDownloadPipeline
+    
+    return SimpleDownloadPipeline(
+        output_base_dir=OUTPUT_DIR,
+        youtube_api_key=YT_API_KEY,
+        gcp_bucket_name=GCP_BUCKET,
+        proxy=None if proxy == DEFAULT_EGRESS else proxy
+    )
+
+class PipelinePool:
+    """
+    Reuses SimpleDownloadPipeline instances (and their GCP/YouTube clients)
+    across jobs. Pipelines keep per-session state, so each one is checked out
+    by a single job at a time; idle pipelines are kept per egress.
+    """
+    
+    def __init__(self):
+        self._idle = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self, proxy: str) -> 'SimpleDownloadPipeline':
+        with self._lock:
+            idle = self._idle.setdefault(proxy, queue.Queue())
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            return create_pipeline(proxy)
+    
+    def release(self, proxy: str, pipeline: 'SimpleDownloadPipeline'):
+        if pipeline is not None:
+            # Every job runs on a fresh thread, close the per-thread yt-dlp clients it created
+            pipeline.downloader.close()
+            self._idle[proxy].put(pipeline)
+
+pipeline_pool = PipelinePool()
+
+def report_bot_detection(proxy: str, result: dict = None, error: str = None):
+    """Blacklist the egress if the job hit a YouTube bot-detection error."""
+    errors = [error] if error else []
+    if result:
+        errors.append(result.get('error'))
+        errors.extend(video.get('error') for video in result.get('failed_videos', []))
+    
+    if any(is_bot_detection_error(e) for e in errors):
+        egress_pool.mark_faulty(proxy)
+
+def no_healthy_egress_response():
+    """503 response returned while every egress is blacklisted."""
+    response = jsonify({'error': 'YouTube bloqueou temporariamente os downloads. Tente novamente mais tarde.'})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(Config.FAULTY_TTL)
+    return response
+
+def start_background_job(func, *args, is_channel: bool = False):
+    """Enqueue a background job on RQ when configured, otherwise start a daemon thread."""
+    if download_queue is not None:
+        # process_*_background catch every exception and mark the job failed, so RQ only
+        # retries when the work horse itself dies (OOM kill, timeout, lost worker)
+        download_queue.enqueue(
+            func, *args,
+            job_timeout=Config.CHANNEL_JOB_TIMEOUT if is_channel else Config.JOB_TIMEOUT,
+            retry=Retry(max=3, interval=[60, 300, 900])
+        )
+    else:
+        threading.Thread(target=func, args=args, daemon=True).start()
 
 def process_youtube_url_background(job_id: str, url: str, options: dict):
     """Background task to process YouTube URL"""
-    job = active_jobs[job_id]
+    job = JobStatus.load(job_id)
+    if not job:
+        logger.error(f"Background job {job_id} not found in job store")
+        return
     
+    proxy = egress_pool.pick()
+    if proxy is None:
+        job.fail("Nenhuma conexão disponível (bloqueio do YouTube). Tente novamente mais tarde.")
+        return
+    
+    pipeline = None
     try:
-        # Create simplified pipeline
-        pipeline = SimpleDownloadPipeline(
-            output_base_dir=Config.OUTPUT_DIR,
-            youtube_api_key=Config.YOUTUBE_API_KEY,
-            gcp_bucket_name="dataset_youtube_katube"
-        )
+        # Reuse an idle pipeline for this egress
+        pipeline = pipeline_pool.acquire(proxy)
         
         # Update job status throughout the process
         job.update("downloading", 10, "Iniciando download...")
         
         # Create session
-        session_name = options.get('session_name') or f"web_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        session_name = options.get('session_name') or f"web_session_{time.strftime('%Y%m%d_%H%M%S')}"
         session_dir = pipeline.create_session(session_name)
         
         # Progress callback for downloads
         def progress_callback(video_url, success, total_videos, current_index):
             progress_percent = min(90, int((current_index / total_videos) * 80) + 10)
-            video_id = video_url.split('watch?v=')[-1].split('&')[0] if 'watch?v=' in video_url else video_url[-11:]
+            match = _VID_RE.search(video_url)
+            video_id = match.group(1) if match else video_url[-11:]
             
             # Add more detailed status for immediate upload flow
             if success:
@@ -99,15 +309,18 @@ def process_youtube_url_background(job_id: str, url: str, options: dict):
                 if current_index > 1:  # Add note about long videos after first video
                     status_msg += " (pode demorar para vídeos longos)"
             
-            job.update("processing", progress_percent, status_msg)
+            job.update_throttled("processing", progress_percent, status_msg,
+                                 force=current_index in (1, total_videos))
         
         # Process URL (video or channel)
-        result = pipeline.process_url(
+        result = run_pipeline(
+            pipeline,
             url=url,
             custom_filename=options.get('filename'),
             max_videos=options.get('max_videos', 2500),
             progress_callback=progress_callback
         )
+        report_bot_detection(proxy, result=result)
         
         job.update("finalizing", 95, "Finalizando processamento...")
         
@@ -126,10 +339,9 @@ def process_youtube_url_background(job_id: str, url: str, options: dict):
                 if result.get('uploaded_to_gcp', False):
                     uploaded_count = 1
             else:
-                # For channels, count from downloaded_videos
-                downloaded_videos = result.get('downloaded_videos', [])
-                total_processed = len(downloaded_videos)
-                uploaded_count = sum(1 for video in downloaded_videos if video.get('uploaded_to_gcp', False))
+                # For channels, use the pipeline's counters
+                total_processed = result.get('downloaded_count', 0)
+                uploaded_count = result.get('uploaded_count', 0)
             
             if uploaded_count == total_processed:
                 job.update("completed", 100, f"✅ Processamento concluído! {uploaded_count} arquivos enviados para GCP.")
@@ -144,7 +356,10 @@ def process_youtube_url_background(job_id: str, url: str, options: dict):
         
     except Exception as e:
         logger.error(f"Background job {job_id} failed: {e}")
+        report_bot_detection(proxy, error=str(e))
         job.fail(str(e))
+    finally:
+        pipeline_pool.release(proxy, pipeline)
 
 @app.route('/')
 def index():
@@ -163,27 +378,23 @@ def process_channel():
             return jsonify({'error': 'URL is required'}), 400
         
         # Check if it's a channel URL or video URL
-        is_channel = any(pattern in channel_url.lower() for pattern in [
-            '/channel/', '/c/', '/user/', '/@', '/playlist?'
-        ])
+        is_channel = bool(_CHANNEL_RE.search(channel_url))
         
-        if not is_channel and 'youtube.com/watch' not in channel_url.lower() and 'youtu.be/' not in channel_url.lower():
+        if not (is_channel or _VIDEO_RE.search(channel_url)):
             return jsonify({'error': 'Please provide a valid YouTube channel or video URL'}), 400
         
+        # Defer new jobs while every egress is blocked by YouTube
+        if not egress_pool.healthy_proxies():
+            return no_healthy_egress_response()
+        
         # Generate job ID
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         
-        # Start background job using threading
-        job_thread = threading.Thread(
-            target=process_channel_background,
-            args=(job_id, channel_url)
-        )
-        job_thread.daemon = True
-        job_thread.start()
+        # Store job status before the worker starts reading it
+        JobStatus(job_id, channel_url).save()
         
-        # Store job status
-        with job_lock:
-            active_jobs[job_id] = JobStatus(job_id, channel_url)
+        # Start background job (task queue or thread)
+        start_background_job(process_channel_background, job_id, channel_url, is_channel=is_channel)
         
         return jsonify({
             'job_id': job_id,
@@ -197,75 +408,67 @@ def process_channel():
 
 def process_channel_background(job_id, url):
     """Background job to process YouTube channel or single video."""
+    job = JobStatus.load(job_id)
+    if not job:
+        logger.error(f"Background job {job_id} not found in job store")
+        return {'success': False, 'error': 'Job not found'}
+    
+    proxy = egress_pool.pick()
+    if proxy is None:
+        job.fail("Nenhuma conexão disponível (bloqueio do YouTube). Tente novamente mais tarde.")
+        return {'success': False, 'error': 'No healthy egress'}
+    
+    pipeline = None
     try:
         logger.info(f"🔄 Starting processing: {url}")
         
         # Check if it's a channel URL or video URL
-        is_channel = any(pattern in url.lower() for pattern in [
-            '/channel/', '/c/', '/user/', '/@', '/playlist?'
-        ])
+        is_channel = bool(_CHANNEL_RE.search(url))
         
         # Update job status
-        with job_lock:
-            if job_id in active_jobs:
-                if is_channel:
-                    active_jobs[job_id].update('downloading', 10, 'Iniciando processamento do canal...')
-                else:
-                    active_jobs[job_id].update('downloading', 10, 'Iniciando processamento do vídeo...')
-        
-        # Initialize simplified pipeline
-        pipeline = SimpleDownloadPipeline(
-            output_base_dir=Config.OUTPUT_DIR,
-            youtube_api_key=Config.YOUTUBE_API_KEY,
-            gcp_bucket_name="dataset_youtube_katube"
-        )
+        if is_channel:
+            job.update('downloading', 10, 'Iniciando processamento do canal...')
+        else:
+            job.update('downloading', 10, 'Iniciando processamento do vídeo...')
         
-        processed_count = 0
-        failed_count = 0
+        # Reuse an idle pipeline for this egress
+        pipeline = pipeline_pool.acquire(proxy)
         
         def progress_callback(video_url, success, total_videos, current_index):
             """Update progress for each video processed."""
-            nonlocal processed_count, failed_count
+            # Extract video ID for display
+            match = _VID_RE.search(video_url)
+            video_id = match.group(1) if match else video_url[-11:]
+            
+            # Show progress as "Video X of Y" format
+            status = f"📹 Vídeo {current_index}/{total_videos} processado"
+            
+            # Calculate progress percentage based on actual total
+            progress_percent = min(90, int((current_index / total_videos) * 90))
             
-            with job_lock:
-                if job_id in active_jobs:
-                    job = active_jobs[job_id]
-                    
-                    # Always count as processed (success) since we're processing all videos
-                    processed_count += 1
-                    
-                    # Extract video ID for display
-                    video_id = video_url.split('watch?v=')[-1].split('&')[0] if 'watch?v=' in video_url else video_url[-11:]
-                    
-                    # Show progress as "Video X of Y" format
-                    status = f"📹 Vídeo {current_index}/{total_videos} processado"
-                    
-                    # Calculate progress percentage based on actual total
-                    progress_percent = min(90, int((current_index / total_videos) * 90))
-                    
-                    job.update('processing', progress_percent, 
-                             f'Processando canal... {status} | ID: {video_id}')
+            job.update_throttled('processing', progress_percent, 
+                                 f'Processando canal... {status} | ID: {video_id}',
+                                 force=current_index in (1, total_videos))
         
         # Process URL (video or channel)
-        result = pipeline.process_url(
+        result = run_pipeline(
+            pipeline,
             url=url,
             max_videos=2500,
             progress_callback=progress_callback
         )
+        report_bot_detection(proxy, result=result)
         
         # Check final upload status (uploads already happened individually)
         if result.get('success', False):
             download_summary = pipeline.get_download_summary()
             
             if download_summary.get('gcp_available', False):
-                with job_lock:
-                    if job_id in active_jobs:
-                        active_jobs[job_id].update('finalizing', 95, 'Finalizando uploads para GCP...')
+                job.update('finalizing', 95, 'Finalizando uploads para GCP...')
                 
-                # Count successful uploads from individual results
-                downloaded_videos = result.get('downloaded_videos', [])
-                uploaded_count = sum(1 for video in downloaded_videos if video.get('uploaded_to_gcp', False))
-                total_count = len(downloaded_videos)
+                # Count successful uploads from the pipeline's counters
+                uploaded_count = result.get('uploaded_count', 0)
+                total_count = result.get('downloaded_count', 0)
                 
                 # Create upload summary for compatibility
                 upload_result = {
@@ -276,28 +479,27 @@ def process_channel_background(job_id, url):
                 }
                 result['gcp_upload'] = upload_result
             
-            # Update final job status
-            with job_lock:
-                if job_id in active_jobs:
-                    if result.get('success', False):
-                        gcp_upload = result.get('gcp_upload', {})
-                        
-                        if result.get('type') == 'channel':
-                            total_videos = result.get('total_videos', 0)
-                            downloaded = result.get('downloaded_count', 0)
-                            
-                            if gcp_upload.get('success', False):
-                                active_jobs[job_id].update('completed', 100, f'✅ Canal processado e enviado para GCP! {downloaded}/{total_videos} vídeos')
-                            else:
-                                active_jobs[job_id].update('completed', 100, f'✅ Canal processado! {downloaded}/{total_videos} vídeos (GCP: {gcp_upload.get("error", "não configurado")})')
-                        else:
-                            if gcp_upload.get('success', False):
-                                active_jobs[job_id].update('completed', 100, f'✅ Vídeo baixado e enviado para GCP!')
-                            else:
-                                active_jobs[job_id].update('completed', 100, f'✅ Vídeo baixado! (GCP: {gcp_upload.get("error", "não configurado")})')
-                    else:
-                        active_jobs[job_id].update('failed', 0, f'❌ Erro: {result.get("error", "Erro desconhecido")}')
-                    active_jobs[job_id].results = result
+        # Update final job status (also on failure, so pollers and /events see a terminal state)
+        if result.get('success', False):
+            gcp_upload = result.get('gcp_upload', {})
+            
+            if result.get('type') == 'channel':
+                total_videos = result.get('total_videos', 0)
+                downloaded = result.get('downloaded_count', 0)
+                
+                if gcp_upload.get('success', False):
+                    job.update('completed', 100, f'✅ Canal processado e enviado para GCP! {downloaded}/{total_videos} vídeos')
+                else:
+                    job.update('completed', 100, f'✅ Canal processado! {downloaded}/{total_videos} vídeos (GCP: {gcp_upload.get("error", "não configurado")})')
+            else:
+                if gcp_upload.get('success', False):
+                    job.update('completed', 100, f'✅ Vídeo baixado e enviado para GCP!')
+                else:
+                    job.update('completed', 100, f'✅ Vídeo baixado! (GCP: {gcp_upload.get("error", "não configurado")})')
+        else:
+            job.update('failed', 0, f'❌ Erro: {result.get("error", "Erro desconhecido")}')
+        job.results = result
+        job.save()
             
         logger.info(f"✅ Processing complete: {result}")
         
@@ -305,14 +507,16 @@ def process_channel_background(job_id, url):
         
     except Exception as e:
         logger.error(f"❌ Channel processing failed: {e}")
+        report_bot_detection(proxy, error=str(e))
         
         # Update job status with error
-        with job_lock:
-            if job_id in active_jobs:
-                active_jobs[job_id].update('failed', 0, f'Erro: {str(e)}')
-                active_jobs[job_id].error = str(e)
+        job.update('failed', 0, f'Erro: {str(e)}')
+        job.error = str(e)
+        job.save()
         
         return {'success': False, 'error': str(e)}
+    finally:
+        pipeline_pool.release(proxy, pipeline)
 
 @app.route('/process', methods=['POST'])
 def process_url():
@@ -325,11 +529,15 @@ def process_url():
             return jsonify({'error': 'URL é obrigatória'}), 400
         
         # Validate YouTube URL
-        if 'youtube.com/watch' not in url and 'youtu.be/' not in url:
+        if not _VIDEO_RE.search(url):
             return jsonify({'error': 'URL inválida. Use uma URL válida do YouTube.'}), 400
         
+        # Defer new jobs while every egress is blocked by YouTube
+        if not egress_pool.healthy_proxies():
+            return no_healthy_egress_response()
+        
         # Create job
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         
         # Get options from request
         options = {
@@ -343,16 +551,11 @@ def process_url():
         }
         
         # Create job status
-        with job_lock:
-            active_jobs[job_id] = JobStatus(job_id, url)
-        
-        # Start background processing
-        thread = threading.Thread(
-            target=process_youtube_url_background,
-            args=(job_id, url, options),
-            daemon=True
-        )
-        thread.start()
+        JobStatus(job_id, url).save()
+        
+        # Start background processing (task queue or thread)
+        start_background_job(process_youtube_url_background, job_id, url, options,
+                             is_channel=bool(_CHANNEL_RE.search(url)))
         
         return jsonify({'job_id': job_id})
         
@@ -364,143 +567,183 @@ def process_url():
 def get_status(job_id):
     """Get job status"""
     try:
-        with job_lock:
-            job = active_jobs.get(job_id)
-            
-            if not job:
-                return jsonify({'error': 'Job não encontrado'}), 404
-            
-            return jsonify({
-                'job_id': job.job_id,
-                'status': job.status,
-                'progress': job.progress,
-                'message': job.message,
-                'start_time': job.start_time.isoformat(),
-                'end_time': job.end_time.isoformat() if job.end_time else None,
-                'error': job.error
-            })
+        job = job_store.load(job_id, STATUS_FIELDS)
+        
+        if not job:
+            return jsonify({'error': 'Job não encontrado'}), 404
+        
+        return jsonify({
+            'job_id': job_id,
+            'status': job['status'],
+            'progress': int(job['progress'] or 0),
+            'message': job['message'],
+            'start_time': job['start_time'],
+            'end_time': job['end_time'] or None,
+            'error': job['error'] or None
+        })
     except Exception as e:
         logger.error(f"Error getting job status {job_id}: {e}")
         return jsonify({'error': 'Erro interno do servidor'}), 500
 
+# Each open /events stream occupies one worker thread, serve the app with a threaded server
+SSE_BLOCK_MS = 5000
+# Streams end after this long and the browser reconnects, so no stream holds a thread for a job's whole lifetime
+SSE_MAX_LIFETIME = 300
+_EVENT_ID_RE = re.compile(r"^\d+(?:-\d+)?$")
+
+@app.route('/events/<job_id>')
+def job_events(job_id):
+    """Stream job progress as Server-Sent Events"""
+    if not job_store.load(job_id, ['status']):
+        return jsonify({'error': 'Job não encontrado'}), 404
+    
+    # Resume after the last event the client saw (reconnects after SSE_MAX_LIFETIME)
+    last_id = request.args.get('last_id') or request.headers.get('Last-Event-ID') or '0'
+    if not _EVENT_ID_RE.match(last_id):
+        last_id = '0'
+    
+    def generate(last_id):
+        deadline = time.monotonic() + SSE_MAX_LIFETIME
+        while True:
+            if time.monotonic() > deadline:
+                yield f"event: reconnect\ndata: {json.dumps({'last_id': last_id})}\n\n"
+                return
+            
+            # Short waits so keepalives go out and a vanished job is noticed within seconds
+            events = job_store.read_events(job_id, last_id, block_ms=SSE_BLOCK_MS)
+            if not events:
+                # Stop once the job was cleaned up or expired, otherwise keep the connection alive
+                if not job_store.load(job_id, ['status']):
+                    return
+                yield ": keepalive\n\n"
+                continue
+            
+            for event_id, event in events:
+                last_id = event_id
+                payload = {
+                    'job_id': job_id,
+                    'status': event.get('status'),
+                    'progress': int(event['progress']) if event.get('progress') else None,
+                    'message': event.get('message'),
+                    'error': event.get('error') or None
+                }
+                yield f"id: {event_id}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+                
+                if event.get('status') in ('completed', 'failed'):
+                    return
+    
+    return Response(generate(last_id), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+def _json_fallback(obj):
+    """orjson default hook for objects it cannot serialize natively."""
+    module = getattr(obj, '__module__', '') or ''
+    if 'pyannote' in module:
+        return f"pyannote.{obj.__class__.__name__}"  # Handle pyannote objects
+    if hasattr(obj, '__dict__'):
+        return str(obj)  # Convert complex objects to string
+    return f"{obj.__class__.__module__}.{obj.__class__.__name__}"  # Better class representation
+
 @app.route('/result/<job_id>')
 def get_result(job_id):
     """Get job results"""
-    with job_lock:
-        job = active_jobs.get(job_id)
-        
-        if not job:
-            return jsonify({'error': 'Job não encontrado'}), 404
-        
-        if job.status != 'completed':
-            return jsonify({'error': 'Job ainda não foi concluído'}), 400
-        
-        # Clean results for JSON serialization
-        def clean_for_json(obj):
-            if isinstance(obj, dict):
-                return {k: clean_for_json(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [clean_for_json(item) for item in obj]
-            elif hasattr(obj, '__module__') and 'pyannote' in str(obj.__module__):
-                return f"pyannote.{obj.__class__.__name__}"  # Handle pyannote objects
-            elif hasattr(obj, '__dict__'):
-                return str(obj)  # Convert complex objects to string
-            elif isinstance(obj, (str, int, float, bool, type(None))):
-                return obj
-            elif hasattr(obj, '__class__'):
-                return f"{obj.__class__.__module__}.{obj.__class__.__name__}"  # Better class representation
-            else:
-                return str(obj)  # Convert anything else to string
-        
-        # Extract GCP upload data separately for better frontend handling
-        results = clean_for_json(job.results) if job.results else {}
-        gcp_upload = results.get('gcp_upload', {})
-        
-        return jsonify({
-            'job_id': job.job_id,
-            'status': job.status,
-            'results': results,
-            'gcp_upload': gcp_upload,
-            'processing_time': (job.end_time - job.start_time).total_seconds() if job.end_time and job.start_time else 0
-        })
+    job = JobStatus.load(job_id)
+    
+    if not job:
+        return jsonify({'error': 'Job não encontrado'}), 404
+    
+    if job.status != 'completed':
+        return jsonify({'error': 'Job ainda não foi concluído'}), 400
+    
+    # Extract GCP upload data separately for better frontend handling
+    results = job.results or {}
+    gcp_upload = results.get('gcp_upload', {})
+    
+    # Single C-level serialization pass, complex objects go through the fallback hook
+    payload = orjson.dumps({
+        'job_id': job.job_id,
+        'status': job.status,
+        'results': results,
+        'gcp_upload': gcp_upload,
+        'processing_time': job.processing_time
+    }, default=_json_fallback, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    
+    return Response(payload, mimetype='application/json')
 
 @app.route('/results/<job_id>')
 def results_page(job_id):
     """Results page"""
-    with job_lock:
-        job = active_jobs.get(job_id)
-        
-        if not job:
-            return "Job não encontrado", 404
+    if not job_store.load(job_id, ['status']):
+        return "Job não encontrado", 404
             
     return render_template('result.html', job_id=job_id)
 
 @app.route('/download/<job_id>/<path:file_type>')
 def download_file(job_id, file_type):
     """Download processed files"""
-    with job_lock:
-        job = active_jobs.get(job_id)
-        
-        if not job or job.status != 'completed':
-            return "Arquivo não disponível", 404
-        
-        session_dir = Path(job.results['session_dir'])
-        
-        try:
-            if file_type == 'results.json':
-                file_path = session_dir / 'pipeline_results.json'
-                return send_file(file_path, as_attachment=True, download_name=f'results_{job_id}.json')
+    job = JobStatus.load(job_id)
+    
+    if not job or job.status != 'completed':
+        return "Arquivo não disponível", 404
+    
+    session_dir = Path(job.results['session_dir'])
+    
+    try:
+        if file_type == 'results.json':
+            file_path = session_dir / 'download_results.json'
+            return send_file(file_path, as_attachment=True,
+                             download_name=f'results_{job_id}.json',
+                             conditional=True, etag=True, max_age=0)
+        
+        elif file_type.startswith('speaker_'):
+            # Download specific speaker files as ZIP
+            from zipstream import ZipStream
             
-            elif file_type.startswith('speaker_'):
-                # Download specific speaker files as ZIP
-                import zipfile
-                import tempfile
-                
-                speaker_id = file_type.replace('speaker_', '')
-                speaker_dir = session_dir / 'stt_ready' / f'speaker_{speaker_id}'
-                
-                if not speaker_dir.exists():
-                    return "Speaker não encontrado", 404
-                
-                # Create temporary ZIP file
-                temp_zip = tempfile.mktemp(suffix='.zip')
-                
-                with zipfile.ZipFile(temp_zip, 'w') as zipf:
-                    for file_path in speaker_dir.glob('*'):
-                        if file_path.is_file():
-                            zipf.write(file_path, file_path.name)
-                
-                return send_file(temp_zip, as_attachment=True, download_name=f'speaker_{speaker_id}_{job_id}.zip')
+            speaker_id = file_type.replace('speaker_', '')
+            speaker_dir = session_dir / 'stt_ready' / f'speaker_{speaker_id}'
             
-            else:
-                return "Tipo de arquivo inválido", 400
-                
-        except Exception as e:
-            logger.error(f"Download error: {e}")
-            return "Erro no download", 500
+            if not speaker_dir.exists():
+                return "Speaker não encontrado", 404
+            
+            # Stream the ZIP straight into the response (no temporary file)
+            zs = ZipStream(sized=True)
+            for file_path in speaker_dir.glob('*'):
+                if file_path.is_file():
+                    zs.add_path(file_path, arcname=file_path.name)
+            
+            response = Response(zs, mimetype='application/zip')
+            response.headers['Content-Disposition'] = f'attachment; filename=speaker_{speaker_id}_{job_id}.zip'
+            response.headers['Content-Length'] = str(len(zs))
+            return response
+        
+        else:
+            return "Tipo de arquivo inválido", 400
+            
+    except Exception as e:
+        logger.error(f"Download error: {e}")
+        return "Erro no download", 500
 
 @app.route('/cleanup/<job_id>', methods=['POST'])
 def cleanup_job(job_id):
     """Clean up job data"""
-    with job_lock:
-        if job_id in active_jobs:
-            del active_jobs[job_id]
+    job_store.delete(job_id)
     
     return jsonify({'message': 'Job removido'})
 
 @app.route('/jobs')
 def list_jobs():
     """List all active jobs (for debugging)"""
-    with job_lock:
-        jobs_info = []
-        for job_id, job in active_jobs.items():
-            jobs_info.append({
-                'job_id': job_id,
-                'status': job.status,
-                'progress': job.progress,
-                'url': job.url,
-                'start_time': job.start_time.isoformat()
-            })
+    jobs_info = []
+    for job in job_store.list_jobs(STATUS_FIELDS):
+        jobs_info.append({
+            'job_id': job['job_id'],
+            'status': job['status'],
+            'progress': int(job['progress'] or 0),
+            'url': job['url'],
+            'start_time': job['start_time']
+        })
     
     return jsonify(jobs_info)
 
@@ -542,4 +785,4 @@ if __name__ == '__main__':
     # app.run(debug=False, host='0.0.0.0', port=5000)
     
     # Para produção no Windows, use: waitress-serve --host=0.0.0.0 --port=5000 app:app
-    # Para produção no Linux, use: gunicorn -w 1 -b 0.0.0.0:5000 app:app
+    # Para produção no Linux, use: gunicorn -w 1 -k gthread --threads 32 -b 0.0.0.0:5000 app:app
@@ -23,8 +23,32 @@ class Config:
     OUTPUT_DIR = AUDIOS_BAIXADOS_DIR / "output"
     TEMP_DIR = AUDIOS_BAIXADOS_DIR / "temp"
     
+    # RAM-backed scratch dir for audio that is uploaded and deleted right away
+    STREAM_TO_GCP = os.getenv('STREAM_TO_GCP', 'true').lower() == 'true'
+    SCRATCH_DIR = Path(os.getenv('SCRATCH_DIR', '/dev/shm/katube'))
+    SCRATCH_MAX_FILE_MB = int(os.getenv('SCRATCH_MAX_FILE_MB', '256'))  # Longer audio goes to disk
+    
+    # Job store settings
+    REDIS_URL = os.getenv('REDIS_URL')
+    JOB_TTL = int(os.getenv('JOB_TTL', '86400'))
+    PROGRESS_UPDATE_INTERVAL = float(os.getenv('PROGRESS_UPDATE_INTERVAL', '0.5'))
+    
+    # Task queue settings (RQ workers, requires REDIS_URL)
+    USE_TASK_QUEUE = os.getenv('USE_TASK_QUEUE', 'false').lower() == 'true'
+    TASK_QUEUE_NAME = os.getenv('TASK_QUEUE_NAME', 'downloads')
+    JOB_TIMEOUT = int(os.getenv('JOB_TIMEOUT', '7200'))
+    # Channel jobs download thousands of videos, RQ must not kill them after the single-video timeout
+    CHANNEL_JOB_TIMEOUT = int(os.getenv('CHANNEL_JOB_TIMEOUT', '259200'))
+    
     # YouTube download settings
     YOUTUBE_FORMAT = "bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best/worst"
+    YT_CONCURRENCY = int(os.getenv('YT_CONCURRENCY', '2'))
+    YT_PRE_DOWNLOAD_SLEEP = float(os.getenv('YT_PRE_DOWNLOAD_SLEEP', '30'))
+    PARALLEL_DOWNLOADS = int(os.getenv('PARALLEL_DOWNLOADS', '4'))
+    
+    # Egress proxies (comma separated) and blacklist time after bot detection
+    YT_PROXIES = [p.strip() for p in os.getenv('YT_PROXIES', '').split(',') if p.strip()]
+    FAULTY_TTL = int(os.getenv('FAULTY_TTL', '14400'))
     
     @classmethod
     def create_directories(cls):
@@ -0,0 +1,78 @@
+"""
+Egress (proxy) health tracking for YouTube bot-detection windows
+"""
+import random
+import threading
+import time
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Error fragments returned by yt-dlp when YouTube blocks an egress IP
+BOT_DETECTION_MARKERS = (
+    "Sign in to confirm",
+    "HTTP Error 429",
+    "HTTP 429",
+    "Too Many Requests",
+)
+
+DEFAULT_EGRESS = "default"
+
+def is_bot_detection_error(error: Optional[str]) -> bool:
+    """Check if an error message means YouTube blocked the current egress."""
+    if not error:
+        return False
+    return any(marker in error for marker in BOT_DETECTION_MARKERS)
+
+class EgressPool:
+    """
+    Pool of egress proxies with a faulty blacklist that expires after a TTL.
+    Uses Redis keys (faulty:<proxy>) when a client is given so every worker
+    sees the same state, otherwise keeps expiry times in process memory.
+    """
+
+    KEY_PREFIX = "faulty:"
+
+    def __init__(self, proxies: Optional[List[str]] = None, faulty_ttl: int = 14400, redis_client=None):
+        """
+        Initialize egress pool.
+
+        Args:
+            proxies: Proxy URLs to rotate through (default: direct connection only)
+            faulty_ttl: Seconds an egress stays blacklisted after bot detection
+            redis_client: Optional Redis client shared with the job store
+        """
+        self.proxies = proxies or [DEFAULT_EGRESS]
+        self.faulty_ttl = faulty_ttl
+        self.redis = redis_client
+        self._faulty_until = {}
+        self._lock = threading.Lock()
+
+    def mark_faulty(self, proxy: str):
+        """Blacklist an egress for faulty_ttl seconds."""
+        logger.warning(f"🚫 Egress marked as faulty for {self.faulty_ttl}s: {proxy}")
+        if self.redis is not None:
+            self.redis.setex(f"{self.KEY_PREFIX}{proxy}", self.faulty_ttl, "1")
+            return
+
+        with self._lock:
+            self._faulty_until[proxy] = time.monotonic() + self.faulty_ttl
+
+    def healthy_proxies(self) -> List[str]:
+        """Return egresses that are not currently blacklisted."""
+        if self.redis is not None:
+            # One MGET over the known proxies, no SCAN across the job store keyspace
+            flags = self.redis.mget([f"{self.KEY_PREFIX}{p}" for p in self.proxies])
+            faulty = {p for p, flag in zip(self.proxies, flags) if flag is not None}
+        else:
+            now = time.monotonic()
+            with self._lock:
+                faulty = {p for p, until in self._faulty_until.items() if until > now}
+
+        return [p for p in self.proxies if p not in faulty]
+
+    def pick(self) -> Optional[str]:
+        """Pick a random healthy egress, or None if all are blacklisted."""
+        healthy = self.healthy_proxies()
+        return random.choice(healthy) if healthy else None
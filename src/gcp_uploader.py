@@ -1,33 +1,155 @@
 """
 Google Cloud Storage uploader for YouTube audio files
 """
+import io
 import os
+import gzip
 import json
+import asyncio
 import logging
+from fnmatch import fnmatch
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 
 try:
     from google.cloud import storage
     from google.oauth2 import service_account
+    from requests.adapters import HTTPAdapter
     GCP_AVAILABLE = True
 except ImportError:
     storage = None
     service_account = None
+    HTTPAdapter = None
     GCP_AVAILABLE = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp
+    from google.auth.transport.requests import Request as AuthRequest
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AuthRequest = None
+    AIOHTTP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Files below this size are sent in a single request (no resumable chunking)
+SINGLE_SHOT_UPLOAD_LIMIT = 8 * 1024 * 1024
+
+# Files below this size are read in one call and sent from memory
+SMALL_FILE_LIMIT = 256 * 1024
+
+# Chunk size for resumable uploads of larger files (must be a multiple of 256 KiB)
+RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Resumable chunk for the upload_results.ndjson writer: each 256 KiB of lines is sent
+# as it fills, instead of the library's 40 MiB default buffer
+NDJSON_CHUNK_SIZE = 256 * 1024
+
+# Content types for the files a session produces (no per-file mimetypes lookup)
+_CT = {
+    '.flac': 'audio/flac',
+    '.json': 'application/json',
+    '.csv': 'text/csv',
+    '.txt': 'text/plain',
+    '.ndjson': 'application/x-ndjson',
+}
+
+def _content_type(local_path: Path) -> str:
+    """Return the content type for a local file based on its suffix."""
+    return _CT.get(local_path.suffix.lower(), 'application/octet-stream')
+
+# Files above this size are uploaded as parallel parts and composed server-side
+COMPOSITE_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+COMPOSITE_PARTS = 4
+
+# Text metadata is stored gzip-encoded (GCS decompresses transparently on download)
+COMPRESSIBLE_SUFFIXES = {'.json', '.ndjson', '.csv', '.txt'}
+GZIP_MIN_SIZE = 1024
+
+# Maximum operations per batch request accepted by the JSON API
+BATCH_MAX_SIZE = 100
+
+# Below this many operations plain calls are cheaper (batch requests skip the connection pool)
+BATCH_MIN_SIZE = 10
+
+# GCS JSON API upload endpoint used by the async uploader
+GCS_UPLOAD_URL = "https://storage.googleapis.com/upload/storage/v1/b/{bucket}/o"
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize an object to one UTF-8 JSON line (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode('utf-8')
+
+@lru_cache(maxsize=8)
+def _load_creds(path: str):
+    """Parse a service account file once per path (credentials are thread-safe to share)."""
+    return service_account.Credentials.from_service_account_file(path)
+
+class _FileSlice(io.RawIOBase):
+    """
+    Read-only view of [offset, offset + length) of an open file, positioned at 0.
+    
+    Resumable uploads require a stream that starts at tell() == 0 and may seek
+    back to retry a chunk, so each composite part gets its own zero-based slice.
+    """
+    
+    def __init__(self, f, offset: int, length: int):
+        self._f = f
+        self._offset = offset
+        self._length = length
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += self._length
+        self._pos = min(max(pos, 0), self._length)
+        return self._pos
+    
+    def readinto(self, b) -> int:
+        n = min(len(b), self._length - self._pos)
+        if n <= 0:
+            return 0
+        self._f.seek(self._offset + self._pos)
+        data = self._f.read(n)
+        b[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
 class GCPUploader:
     """
     Google Cloud Storage uploader for audio files and metadata
     """
     
+    # Resolved service account file per credentials_path (shared by all instances)
+    _credentials_files: Dict[Optional[str], Optional[str]] = {}
+    
     def __init__(self, 
                  project_id: str = "GCP_PROJECT_ID",
                  bucket_name: str = "GCP_BUCKET_NAME",
-                 credentials_path: Optional[str] = None):
+                 credentials_path: Optional[str] = None,
+                 max_workers: int = 16,
+                 pool_size: int = 64):
         """
         Initialize GCP uploader.
         
@@ -35,13 +157,21 @@ class GCPUploader:
             project_id: GCP project ID
             bucket_name: GCS bucket name
             credentials_path: Path to service account JSON file
+            max_workers: Number of parallel uploads in upload_session_files
+            pool_size: HTTP connection pool size of the storage client
         """
         self.project_id = project_id
         self.bucket_name = bucket_name
         self.credentials_path = credentials_path
+        self.max_workers = max_workers
+        self.pool_size = pool_size
         self.client = None
         self.bucket = None
         
+        # Serializes token refreshes of the async uploads (asyncio locks belong to one event loop)
+        self._token_lock = None
+        self._token_lock_loop = None
+        
         if not GCP_AVAILABLE:
             logger.warning("⚠️ Google Cloud Storage libraries not available. Install with: pip install google-cloud-storage")
             return
@@ -51,33 +181,22 @@ class GCPUploader:
     def _initialize_client(self):
         """Initialize GCS client with credentials."""
         try:
-            # Always try to use the credentials file first
-            credentials_file = "gcp_credentials.json"
-            if Path(credentials_file).exists():
-                # Use service account credentials from local file
-                credentials = service_account.Credentials.from_service_account_file(
-                    credentials_file
-                )
+            credentials_file = self._resolve_credentials_file()
+            if credentials_file:
+                # Use service account credentials from file
+                credentials = _load_creds(credentials_file)
                 self.client = storage.Client(
                     project=self.project_id,
                     credentials=credentials
                 )
                 logger.info(f"✅ GCS client initialized with service account: {credentials_file}")
-            elif self.credentials_path and Path(self.credentials_path).exists():
-                # Use service account file from specified path
-                credentials = service_account.Credentials.from_service_account_file(
-                    self.credentials_path
-                )
-                self.client = storage.Client(
-                    project=self.project_id,
-                    credentials=credentials
-                )
-                logger.info(f"✅ GCS client initialized with service account: {self.credentials_path}")
             else:
-                # Use default credentials (environment variable or gcloud auth)
+                # Use default credentials (GOOGLE_APPLICATION_CREDENTIALS or gcloud auth)
                 self.client = storage.Client(project=self.project_id)
                 logger.info(f"✅ GCS client initialized with default credentials")
             
+            self._configure_http_pool()
+            
             # Get bucket
             self.bucket = self.client.bucket(self.bucket_name)
             logger.info(f"✅ Connected to bucket: {self.bucket_name}")
@@ -87,6 +206,47 @@ class GCPUploader:
             self.client = None
             self.bucket = None
     
+    def _resolve_credentials_file(self) -> Optional[str]:
+        """
+        Find the service account file to load, or None to use default credentials.
+        
+        GOOGLE_APPLICATION_CREDENTIALS wins (the SDK reads it itself), then the
+        configured credentials_path, then gcp_credentials.json in the working
+        directory. A found file is cached per credentials_path until
+        clear_credentials_cache(); a miss is not cached, so files added later are seen.
+        """
+        if os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
+            return None
+        
+        if self.credentials_path in GCPUploader._credentials_files:
+            return GCPUploader._credentials_files[self.credentials_path]
+        
+        resolved = None
+        for candidate in (self.credentials_path, "gcp_credentials.json"):
+            if candidate and Path(candidate).exists():
+                resolved = str(Path(candidate).resolve())
+                break
+        
+        if resolved is not None:
+            GCPUploader._credentials_files[self.credentials_path] = resolved
+        return resolved
+    
+    @classmethod
+    def clear_credentials_cache(cls):
+        """Forget resolved credential paths and parsed service account files (e.g. after rotation)."""
+        cls._credentials_files.clear()
+        _load_creds.cache_clear()
+    
+    def _configure_http_pool(self):
+        """Enlarge the storage client's connection pool (urllib3 default is 10) for parallel uploads."""
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            pool_block=False
+        )
+        # _http lazily creates the AuthorizedSession stored in _http_internal
+        self.client._http.mount("https://", adapter)
+    
     def is_available(self) -> bool:
         """Check if GCP uploader is available and configured."""
         return GCP_AVAILABLE and self.client is not None and self.bucket is not None
@@ -94,7 +254,8 @@ class GCPUploader:
     def upload_file(self, 
                    local_path: Path, 
                    remote_path: str,
-                   metadata: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                   metadata: Optional[Dict[str, str]] = None,
+                   size: Optional[int] = None) -> Dict[str, Any]:
         """
         Upload a single file to GCS.
         
@@ -102,6 +263,7 @@ class GCPUploader:
             local_path: Local file path
             remote_path: Remote path in bucket
             metadata: Optional metadata to attach to file
+            size: File size in bytes if already known (skips a stat call)
             
         Returns:
             Dictionary with upload results
@@ -112,22 +274,48 @@ class GCPUploader:
                 'error': 'GCP uploader not available'
             }
         
-        if not local_path.exists():
-            return {
-                'success': False,
-                'error': f'Local file not found: {local_path}'
-            }
-        
         try:
+            if size is None:
+                size = local_path.stat().st_size
+            
             # Create blob
             blob = self.bucket.blob(remote_path)
             
+            # Small files skip chunking (and its 16 MiB default buffer), large files use 8 MiB chunks
+            blob.chunk_size = None if size < SINGLE_SHOT_UPLOAD_LIMIT else RESUMABLE_CHUNK_SIZE
+            
             # Set metadata if provided
             if metadata:
                 blob.metadata = metadata
             
             # Upload file
-            blob.upload_from_filename(str(local_path))
+            if GZIP_MIN_SIZE < size < SINGLE_SHOT_UPLOAD_LIMIT and local_path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+                # Compress text metadata in memory, FLAC is already compressed
+                buf = io.BytesIO()
+                with open(local_path, 'rb') as f, gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=3) as gz:
+                    gz.write(f.read())
+                blob.content_encoding = 'gzip'
+                blob.upload_from_file(
+                    buf,
+                    size=buf.tell(),
+                    rewind=True,
+                    content_type=_content_type(local_path)
+                )
+            elif size < SMALL_FILE_LIMIT:
+                # One read, one allocation, no streamed copy through the SDK buffer
+                blob.upload_from_string(local_path.read_bytes(), content_type=_content_type(local_path))
+            elif size < SINGLE_SHOT_UPLOAD_LIMIT:
+                # Known size with no chunking: one multipart request, no resumable session setup
+                with open(local_path, 'rb') as f:
+                    blob.upload_from_file(
+                        f,
+                        size=size,
+                        content_type=_content_type(local_path)
+                    )
+            elif size > COMPOSITE_UPLOAD_THRESHOLD:
+                self._upload_composite(local_path, blob, size)
+            else:
+                blob.upload_from_filename(str(local_path), content_type=_content_type(local_path))
             
             logger.info(f"✅ Uploaded: {local_path.name} → gs://{self.bucket_name}/{remote_path}")
             
@@ -136,10 +324,17 @@ class GCPUploader:
                 'local_path': str(local_path),
                 'remote_path': remote_path,
                 'bucket': self.bucket_name,
-                'size': local_path.stat().st_size,
+                'size': size,
                 'public_url': f"gs://{self.bucket_name}/{remote_path}"
             }
             
+        except FileNotFoundError:
+            # Checked on open/stat instead of a separate exists() call
+            return {
+                'success': False,
+                'error': f'Local file not found: {local_path}'
+            }
+            
         except Exception as e:
             logger.error(f"❌ Upload failed: {local_path.name} - {e}")
             return {
@@ -149,26 +344,79 @@ class GCPUploader:
                 'remote_path': remote_path
             }
     
-    def upload_session_files(self, 
-                           session_dir: Path,
-                           session_name: str,
-                           include_patterns: List[str] = None) -> Dict[str, Any]:
+    def _upload_composite(self, local_path: Path, blob: Any, size: int):
         """
-        Upload all files from a download session to GCS.
+        Upload a large file as parallel part objects, then compose them into the final blob.
         
         Args:
-            session_dir: Local session directory
-            session_name: Session name for organizing in bucket
-            include_patterns: File patterns to include (default: all)
+            local_path: Local file path
+            blob: Destination blob (metadata already set)
+            size: File size in bytes
+        """
+        part_size = -(-size // COMPOSITE_PARTS)
+        parts = [self.bucket.blob(f"{blob.name}.part{i}") for i in range(COMPOSITE_PARTS)]
+        
+        def upload_part(index):
+            offset = index * part_size
+            length = min(part_size, size - offset)
+            with open(local_path, 'rb') as f:
+                part = parts[index]
+                part.chunk_size = RESUMABLE_CHUNK_SIZE
+                part.upload_from_file(_FileSlice(f, offset, length), size=length,
+                                      content_type=_content_type(local_path))
+        
+        try:
+            with ThreadPoolExecutor(max_workers=COMPOSITE_PARTS) as executor:
+                list(executor.map(upload_part, range(COMPOSITE_PARTS)))
             
-        Returns:
-            Dictionary with upload results
+            blob.content_type = _content_type(local_path)
+            blob.compose(parts)
+        finally:
+            # Part objects are temporary, remove them even if the upload failed
+            for part in parts:
+                try:
+                    part.delete()
+                except Exception:
+                    pass
+    
+    @staticmethod
+    def _prefetch_file(local_path: Path):
+        """Ask the kernel to start reading a file into the page cache (no-op where unsupported)."""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(local_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _iter_files(directory: Path, patterns: List[str], rel_prefix: str = '') -> Iterator[Tuple[Path, str, int]]:
+        """
+        Yield (path, relative path, size) for regular files in a directory matching any pattern.
+        
+        A single scandir pass replaces one glob per pattern plus an is_file()
+        and stat() per match. The relative path is rel_prefix + file name.
         """
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            return
+        
+        with entries:
+            for entry in entries:
+                if entry.is_file() and any(fnmatch(entry.name, pattern) for pattern in patterns):
+                    yield Path(entry.path), rel_prefix + entry.name, entry.stat().st_size
+    
+    def _check_session_upload(self, session_dir: Path) -> Optional[Dict[str, Any]]:
+        """Return an error result if a session upload cannot start, None otherwise."""
         if not self.is_available():
             return {
                 'success': False,
                 'error': 'GCP uploader not available',
-                'uploaded_files': [],
                 'failed_files': []
             }
         
@@ -176,102 +424,120 @@ class GCPUploader:
             return {
                 'success': False,
                 'error': f'Session directory not found: {session_dir}',
-                'uploaded_files': [],
                 'failed_files': []
             }
         
-        # Default patterns to include all common files
-        if include_patterns is None:
-            include_patterns = ['*.flac', '*.json', '*.txt', '*.csv']
-        
-        uploaded_files = []
-        failed_files = []
+        return None
+    
+    def _collect_upload_tasks(self,
+                              session_dir: Path,
+                              session_name: str,
+                              session_prefix: str,
+                              include_patterns: List[str]) -> List[tuple]:
+        """
+        Collect (local path, remote path, metadata, size) for every session file to upload.
         
-        logger.info(f"🔄 Starting upload of session: {session_name}")
+        Args:
+            session_dir: Local session directory
+            session_name: Session name for organizing in bucket
+            session_prefix: Session folder in bucket
+            include_patterns: File patterns to include
+            
+        Returns:
+            List of upload task tuples
+        """
+        upload_tasks = []
         
-        # Create session folder structure in bucket
-        session_prefix = f"youtube_downloads/{session_name}"
+        # One timestamp for the whole session instead of one per file
+        session_ts = datetime.now().isoformat()
         
-        # Upload files by category
+        # Upload files by category (root files go under the session folder itself)
         categories = {
-            'downloads': session_dir / 'downloads',
-            'metadata': session_dir / 'metadata'
+            'downloads': 'downloads/',
+            'metadata': 'metadata/',
+            'root': ''
         }
         
-        # Also include root files
-        root_files = []
-        for pattern in include_patterns:
-            root_files.extend(session_dir.glob(pattern))
+        for category, rel_prefix in categories.items():
+            logger.info(f"📁 Collecting {category} files...")
+            
+            # Keys shared by every file in this category
+            base_metadata = {
+                'session_name': session_name,
+                'category': category,
+                'upload_time': session_ts
+            }
+            
+            for file_path, rel_path, size in self._iter_files(session_dir / rel_prefix, include_patterns, rel_prefix):
+                # Remote layout mirrors the session folder
+                remote_path = f"{session_prefix}/{rel_path}"
+                
+                # Create metadata
+                metadata = {**base_metadata, 'original_path': rel_path}
+                
+                upload_tasks.append((file_path, remote_path, metadata, size))
+        
+        return upload_tasks
+    
+    def _save_upload_summary(self,
+                             session_name: str,
+                             session_prefix: str,
+                             results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Stream per-file results to upload_results.ndjson and write the aggregate upload_summary.json.
         
-        if root_files:
-            categories['root'] = session_dir
+        Only counters (and failures) are kept in memory, so memory does not
+        grow with the number of uploaded files.
         
-        for category, category_dir in categories.items():
-            if not category_dir.exists():
-                continue
-            
-            logger.info(f"📁 Uploading {category} files...")
+        Args:
+            session_name: Session name
+            session_prefix: Session folder in bucket
+            results: Upload results, consumed as they complete
             
-            if category == 'root':
-                # Handle root files specially
-                files_to_upload = root_files
-            else:
-                # Get all files matching patterns in subdirectory
-                files_to_upload = []
-                for pattern in include_patterns:
-                    files_to_upload.extend(category_dir.glob(pattern))
-            
-            for file_path in files_to_upload:
-                if file_path.is_file():
-                    # Create remote path
-                    if category == 'root':
-                        remote_path = f"{session_prefix}/{file_path.name}"
-                    else:
-                        remote_path = f"{session_prefix}/{category}/{file_path.name}"
-                    
-                    # Create metadata
-                    metadata = {
-                        'session_name': session_name,
-                        'category': category,
-                        'upload_time': datetime.now().isoformat(),
-                        'original_path': str(file_path.relative_to(session_dir))
-                    }
-                    
-                    # Upload file
-                    result = self.upload_file(file_path, remote_path, metadata)
-                    
-                    if result['success']:
-                        uploaded_files.append(result)
-                    else:
-                        failed_files.append(result)
+        Returns:
+            Dictionary with upload results
+        """
+        uploaded_count = 0
+        total_bytes = 0
+        failed_files = []
+        
+        # One JSON line per file, sent in 256 KiB resumable chunks while uploads are still completing
+        results_path = f"{session_prefix}/upload_results.ndjson"
+        results_blob = self.bucket.blob(results_path)
+        with results_blob.open('wb', content_type='application/x-ndjson', chunk_size=NDJSON_CHUNK_SIZE) as fp:
+            for result in results:
+                fp.write(_dumps_line(result))
+                
+                if result['success']:
+                    uploaded_count += 1
+                    total_bytes += result['size']
+                else:
+                    failed_files.append(result)
         
         # Upload summary
-        total_files = len(uploaded_files) + len(failed_files)
-        success_rate = len(uploaded_files) / total_files if total_files > 0 else 0
+        total_files = uploaded_count + len(failed_files)
+        success_rate = uploaded_count / total_files if total_files > 0 else 0
         
-        # Create upload summary
+        # Create upload summary (aggregates only, per-file results live in the NDJSON)
         upload_summary = {
             'session_name': session_name,
             'upload_time': datetime.now().isoformat(),
             'total_files': total_files,
-            'uploaded_count': len(uploaded_files),
+            'uploaded_count': uploaded_count,
             'failed_count': len(failed_files),
             'success_rate': success_rate,
+            'total_bytes': total_bytes,
             'bucket': self.bucket_name,
             'session_prefix': session_prefix,
-            'uploaded_files': uploaded_files,
-            'failed_files': failed_files
+            'results_url': f"gs://{self.bucket_name}/{results_path}"
         }
         
         # Save upload summary to bucket
         summary_path = f"{session_prefix}/upload_summary.json"
         summary_blob = self.bucket.blob(summary_path)
-        summary_blob.upload_from_string(
-            json.dumps(upload_summary, indent=2, ensure_ascii=False),
-            content_type='application/json'
-        )
+        summary_blob.upload_from_string(_dumps_line(upload_summary), content_type='application/json')
         
-        logger.info(f"✅ Session upload complete: {len(uploaded_files)}/{total_files} files uploaded")
+        logger.info(f"✅ Session upload complete: {uploaded_count}/{total_files} files uploaded")
         logger.info(f"📊 Upload summary saved: gs://{self.bucket_name}/{summary_path}")
         
         return {
@@ -280,14 +546,189 @@ class GCPUploader:
             'bucket': self.bucket_name,
             'session_prefix': session_prefix,
             'total_files': total_files,
-            'uploaded_count': len(uploaded_files),
+            'uploaded_count': uploaded_count,
             'failed_count': len(failed_files),
             'success_rate': success_rate,
-            'uploaded_files': uploaded_files,
+            'total_bytes': total_bytes,
             'failed_files': failed_files,
+            'results_url': f"gs://{self.bucket_name}/{results_path}",
             'summary_url': f"gs://{self.bucket_name}/{summary_path}"
         }
     
+    def upload_session_files(self, 
+                           session_dir: Path,
+                           session_name: str,
+                           include_patterns: List[str] = None) -> Dict[str, Any]:
+        """
+        Upload all files from a download session to GCS.
+        
+        Args:
+            session_dir: Local session directory
+            session_name: Session name for organizing in bucket
+            include_patterns: File patterns to include (default: all)
+            
+        Returns:
+            Dictionary with upload results
+        """
+        error = self._check_session_upload(session_dir)
+        if error:
+            return error
+        
+        # Default patterns to include all common files
+        if include_patterns is None:
+            include_patterns = ['*.flac', '*.json', '*.ndjson', '*.txt', '*.csv']
+        
+        logger.info(f"🔄 Starting upload of session: {session_name}")
+        
+        # Create session folder structure in bucket
+        session_prefix = f"youtube_downloads/{session_name}"
+        
+        upload_tasks = self._collect_upload_tasks(session_dir, session_name, session_prefix, include_patterns)
+        
+        # Read ahead one batch of files so disk reads overlap the uploads in flight
+        for task in upload_tasks[:self.max_workers]:
+            self._prefetch_file(task[0])
+        
+        def upload_with_prefetch(index):
+            # Workers pick tasks in order, so this file starts after the current batch
+            if index + self.max_workers < len(upload_tasks):
+                self._prefetch_file(upload_tasks[index + self.max_workers][0])
+            return self.upload_file(*upload_tasks[index])
+        
+        # Upload files in parallel (network bound, the storage client is shared across threads)
+        logger.info(f"⬆️ Uploading {len(upload_tasks)} files with {self.max_workers} workers...")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(upload_with_prefetch, i) for i in range(len(upload_tasks))]
+            
+            # Results are streamed to the bucket as each upload completes
+            return self._save_upload_summary(
+                session_name, session_prefix, (future.result() for future in as_completed(futures))
+            )
+    
+    async def _get_access_token(self) -> str:
+        """Return a valid bearer token for the JSON API, refreshing it off the event loop when expired."""
+        credentials = self.client._credentials
+        if credentials.valid:
+            return credentials.token
+        
+        loop = asyncio.get_running_loop()
+        if self._token_lock_loop is not loop:
+            self._token_lock = asyncio.Lock()
+            self._token_lock_loop = loop
+        
+        # One refresh per expiry: coroutines queued on the lock reuse the new token
+        async with self._token_lock:
+            if not credentials.valid:
+                await loop.run_in_executor(None, credentials.refresh, AuthRequest())
+        return credentials.token
+    
+    async def _aupload_file(self,
+                            session: 'aiohttp.ClientSession',
+                            semaphore: asyncio.Semaphore,
+                            local_path: Path,
+                            remote_path: str,
+                            metadata: Optional[Dict[str, str]] = None,
+                            size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Upload a single file through the GCS JSON API (multipart: metadata + media in one request).
+        
+        Returns:
+            Dictionary with upload results (same shape as upload_file)
+        """
+        async with semaphore:
+            try:
+                token = await self._get_access_token()
+                if size is None:
+                    size = local_path.stat().st_size
+                content_type = _content_type(local_path)
+                
+                with open(local_path, 'rb') as f:
+                    with aiohttp.MultipartWriter('related') as body:
+                        body.append_json({'name': remote_path, 'metadata': metadata or {}})
+                        body.append(f, {'Content-Type': content_type})
+                        
+                        async with session.post(
+                            GCS_UPLOAD_URL.format(bucket=self.bucket_name),
+                            params={'uploadType': 'multipart'},
+                            data=body,
+                            headers={'Authorization': f'Bearer {token}'}
+                        ) as response:
+                            if response.status >= 400:
+                                raise RuntimeError(f"HTTP {response.status}: {await response.text()}")
+                
+                logger.info(f"✅ Uploaded: {local_path.name} → gs://{self.bucket_name}/{remote_path}")
+                
+                return {
+                    'success': True,
+                    'local_path': str(local_path),
+                    'remote_path': remote_path,
+                    'bucket': self.bucket_name,
+                    'size': size,
+                    'public_url': f"gs://{self.bucket_name}/{remote_path}"
+                }
+                
+            except Exception as e:
+                logger.error(f"❌ Upload failed: {local_path.name} - {e}")
+                return {
+                    'success': False,
+                    'error': str(e),
+                    'local_path': str(local_path),
+                    'remote_path': remote_path
+                }
+    
+    async def aupload_session_files(self,
+                                    session_dir: Path,
+                                    session_name: str,
+                                    include_patterns: List[str] = None,
+                                    max_concurrency: int = 64) -> Dict[str, Any]:
+        """
+        Async variant of upload_session_files using aiohttp on a single event loop.
+        
+        Args:
+            session_dir: Local session directory
+            session_name: Session name for organizing in bucket
+            include_patterns: File patterns to include (default: all)
+            max_concurrency: Maximum number of uploads in flight
+            
+        Returns:
+            Dictionary with upload results
+        """
+        if not AIOHTTP_AVAILABLE:
+            return {
+                'success': False,
+                'error': 'aiohttp not available. Install with: pip install aiohttp',
+                'failed_files': []
+            }
+        
+        error = self._check_session_upload(session_dir)
+        if error:
+            return error
+        
+        # Default patterns to include all common files
+        if include_patterns is None:
+            include_patterns = ['*.flac', '*.json', '*.ndjson', '*.txt', '*.csv']
+        
+        logger.info(f"🔄 Starting async upload of session: {session_name}")
+        
+        # Create session folder structure in bucket
+        session_prefix = f"youtube_downloads/{session_name}"
+        
+        upload_tasks = self._collect_upload_tasks(session_dir, session_name, session_prefix, include_patterns)
+        
+        logger.info(f"⬆️ Uploading {len(upload_tasks)} files with up to {max_concurrency} concurrent requests...")
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(*(
+                self._aupload_file(session, semaphore, *task) for task in upload_tasks
+            ))
+        
+        # Summary upload uses the blocking client, keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._save_upload_summary, session_name, session_prefix, results
+        )
+    
     def list_session_files(self, session_name: str) -> List[Dict[str, Any]]:
         """
         List files for a specific session in the bucket.
@@ -304,11 +745,18 @@ class GCPUploader:
         session_prefix = f"youtube_downloads/{session_name}/"
         
         try:
-            blobs = self.client.list_blobs(self.bucket, prefix=session_prefix)
+            # Request every field read below in the List call itself (no per-blob metadata GETs)
+            blobs = self.client.list_blobs(
+                self.bucket,
+                prefix=session_prefix,
+                page_size=1000,
+                fields="items(name,size,timeCreated,updated,contentType,metadata),nextPageToken"
+            )
             
+            # Walk whole pages (1000 blobs per List call, the API maximum)
             files = []
-            for blob in blobs:
-                files.append({
+            for page in blobs.pages:
+                files.extend({
                     'name': blob.name,
                     'size': blob.size,
                     'created': blob.time_created.isoformat() if blob.time_created else None,
@@ -316,7 +764,7 @@ class GCPUploader:
                     'content_type': blob.content_type,
                     'metadata': blob.metadata or {},
                     'public_url': f"gs://{self.bucket_name}/{blob.name}"
-                })
+                } for blob in page)
             
             return files
             
@@ -324,6 +772,92 @@ class GCPUploader:
             logger.error(f"❌ Failed to list session files: {e}")
             return []
     
+    def _run_bulk(self, blobs: List[Any], operation) -> int:
+        """
+        Apply an operation to many blobs, coalescing calls into batch requests.
+        
+        Args:
+            blobs: Blobs to operate on
+            operation: Callable applied to each blob (e.g. lambda b: b.delete())
+            
+        Returns:
+            Number of blobs processed
+        """
+        if len(blobs) < BATCH_MIN_SIZE:
+            for blob in blobs:
+                operation(blob)
+            return len(blobs)
+        
+        for start in range(0, len(blobs), BATCH_MAX_SIZE):
+            with self.client.batch():
+                for blob in blobs[start:start + BATCH_MAX_SIZE]:
+                    operation(blob)
+        
+        return len(blobs)
+    
+    def update_session_metadata(self, session_name: str, metadata: Dict[str, str]) -> int:
+        """
+        Merge custom metadata into every blob of a session.
+        
+        Args:
+            session_name: Session name
+            metadata: Metadata keys to set on each blob
+            
+        Returns:
+            Number of blobs patched (0 on failure)
+        """
+        if not self.is_available():
+            return 0
+        
+        try:
+            blobs = list(self.client.list_blobs(
+                self.bucket,
+                prefix=f"youtube_downloads/{session_name}/",
+                page_size=1000,
+                fields="items(name,metadata),nextPageToken"
+            ))
+            
+            def patch(blob):
+                blob.metadata = {**(blob.metadata or {}), **metadata}
+                blob.patch()
+            
+            count = self._run_bulk(blobs, patch)
+            logger.info(f"✅ Updated metadata on {count} files of session: {session_name}")
+            return count
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to update session metadata: {e}")
+            return 0
+    
+    def delete_session_files(self, session_name: str) -> int:
+        """
+        Delete every blob of a session from the bucket.
+        
+        Args:
+            session_name: Session name
+            
+        Returns:
+            Number of blobs deleted (0 on failure)
+        """
+        if not self.is_available():
+            return 0
+        
+        try:
+            blobs = list(self.client.list_blobs(
+                self.bucket,
+                prefix=f"youtube_downloads/{session_name}/",
+                page_size=1000,
+                fields="items(name),nextPageToken"
+            ))
+            
+            count = self._run_bulk(blobs, lambda blob: blob.delete())
+            logger.info(f"🗑️ Deleted {count} files of session: {session_name}")
+            return count
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to delete session files: {e}")
+            return 0
+    
     def get_bucket_info(self) -> Dict[str, Any]:
         """
         Get information about the configured bucket.
@@ -0,0 +1,94 @@
+"""
+On-disk cache of yt-dlp video info keyed by video ID
+"""
+import os
+import re
+import json
+import time
+import tempfile
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/|shorts/)([A-Za-z0-9_-]{11})")
+
+# Only these fields are used downstream; the full info dict is large and not JSON safe
+INFO_FIELDS = ('id', 'title', 'duration', 'channel', 'channel_id', 'upload_date')
+
+def extract_video_id(url: str) -> Optional[str]:
+    """Extract the 11 character video ID from a YouTube URL."""
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+@lru_cache(maxsize=4096)
+def _read_info(path: str, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is part of the key so a rewritten entry is read again
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+class VideoInfoCache:
+    """
+    Cache of trimmed yt-dlp info dicts, one JSON file per video, with a max age.
+    Entries are written atomically and read through an in-process LRU.
+    """
+
+    def __init__(self, cache_dir: Path, max_age: float = 7 * 86400):
+        """
+        Initialize info cache.
+
+        Args:
+            cache_dir: Directory holding <video_id>.json entries
+            max_age: Seconds an entry stays valid
+        """
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """Return cached info for a video, or None if missing or expired."""
+        path = self.cache_dir / f"{video_id}.json"
+        try:
+            stat = path.stat()
+            if time.time() - stat.st_mtime > self.max_age:
+                return None
+            return dict(_read_info(str(path), stat.st_mtime_ns))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, video_id: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Store the used fields of an info dict and return them."""
+        trimmed = {key: info.get(key) for key in INFO_FIELDS}
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.cache_dir,
+                                             suffix='.tmp', delete=False) as f:
+                json.dump(trimmed, f, ensure_ascii=False)
+            os.replace(f.name, self.cache_dir / f"{video_id}.json")
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache video info for {video_id}: {e}")
+        return trimmed
+
+    def get_or_fetch(self, url: str, fetch: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return video info from the cache, calling fetch(url) on a miss.
+
+        Args:
+            url: YouTube video URL
+            fetch: Function performing the real yt-dlp extraction
+
+        Returns:
+            Trimmed info dictionary
+        """
+        video_id = extract_video_id(url)
+        if video_id:
+            cached = self.get(video_id)
+            if cached is not None:
+                return cached
+
+        info = fetch(url)
+        video_id = info.get('id') or video_id
+        if not video_id:
+            return info
+        return self.put(video_id, info)
@@ -0,0 +1,194 @@
+"""
+Job status store for background processing jobs
+"""
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+class JobStore:
+    """
+    Job status store backed by Redis (one hash per job with TTL).
+    Falls back to an in-process dictionary when Redis is not configured,
+    which keeps single-process local runs working without extra services.
+    Every write is also appended to a per-job event stream (jobs:events:<id>)
+    so clients can follow progress without polling.
+    """
+
+    KEY_PREFIX = "job:"
+    EVENTS_PREFIX = "jobs:events:"
+    EVENTS_MAXLEN = 1000
+
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 86400):
+        """
+        Initialize job store.
+
+        Args:
+            redis_url: Redis connection URL (e.g. redis://localhost:6379/0)
+            ttl: Time to live for job hashes in seconds
+        """
+        self.ttl = ttl
+        self.redis = None
+        self._jobs = {}
+        self._events = {}
+        self._event_seq = 0
+        self._lock = threading.Lock()
+        self._events_changed = threading.Condition(self._lock)
+
+        if not redis_url:
+            logger.info("ℹ️ REDIS_URL not set. Using in-memory job store (single process only)")
+            return
+
+        if not REDIS_AVAILABLE:
+            logger.warning("⚠️ Redis library not available. Install with: pip install redis")
+            return
+
+        try:
+            self.redis = redis.Redis.from_url(redis_url, decode_responses=True)
+            self.redis.ping()
+            logger.info(f"✅ Job store connected to Redis: {redis_url}")
+        except Exception as e:
+            logger.error(f"❌ Failed to connect to Redis, using in-memory job store: {e}")
+            self.redis = None
+
+    def is_distributed(self) -> bool:
+        """Check if jobs are shared across processes (Redis backend)."""
+        return self.redis is not None
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    def _events_key(self, job_id: str) -> str:
+        return f"{self.EVENTS_PREFIX}{job_id}"
+
+    def save(self, job_id: str, fields: Dict[str, str]):
+        """
+        Write job fields and publish them as a progress event.
+
+        Args:
+            job_id: Job identifier
+            fields: Flat mapping of string fields to store
+        """
+        event = {k: v for k, v in fields.items() if k != 'results'}
+        event['job_id'] = job_id
+
+        if self.redis is None:
+            with self._lock:
+                self._jobs.setdefault(job_id, {}).update(fields)
+                self._event_seq += 1
+                events = self._events.setdefault(job_id, deque(maxlen=self.EVENTS_MAXLEN))
+                events.append((str(self._event_seq), event))
+                self._events_changed.notify_all()
+            return
+
+        key = self._key(job_id)
+        events_key = self._events_key(job_id)
+
+        pipe = self.redis.pipeline()
+        pipe.hset(key, mapping=fields)
+        pipe.expire(key, self.ttl)
+        pipe.xadd(events_key, event, maxlen=self.EVENTS_MAXLEN, approximate=True)
+        pipe.expire(events_key, self.ttl)
+        pipe.execute()
+
+    def read_events(self, job_id: str, last_id: str = '0', block_ms: int = 30000) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        Wait for progress events newer than last_id.
+
+        Args:
+            job_id: Job identifier
+            last_id: ID of the last event already seen ('0' for all)
+            block_ms: Maximum time to wait for new events
+
+        Returns:
+            List of (event_id, event_fields) tuples, empty on timeout
+        """
+        if self.redis is None:
+            def newer():
+                return [(eid, dict(event)) for eid, event in self._events.get(job_id, ())
+                        if int(eid) > int(last_id)]
+
+            with self._events_changed:
+                self._events_changed.wait_for(newer, timeout=block_ms / 1000)
+                return newer()
+
+        response = self.redis.xread({self._events_key(job_id): last_id}, block=block_ms, count=10)
+        return [entry for _, entries in response for entry in entries]
+
+    def load(self, job_id: str, fields: Optional[List[str]] = None) -> Optional[Dict[str, str]]:
+        """
+        Read job fields.
+
+        Args:
+            job_id: Job identifier
+            fields: Optional subset of fields to read (default: all)
+
+        Returns:
+            Dictionary with job fields or None if job does not exist
+        """
+        if self.redis is None:
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return None
+                if fields is None:
+                    return dict(job)
+                return {f: job.get(f, '') for f in fields}
+
+        key = self._key(job_id)
+        if fields is None:
+            job = self.redis.hgetall(key)
+            return job or None
+
+        values = self.redis.hmget(key, fields)
+        if all(v is None for v in values):
+            return None
+        return {f: (v if v is not None else '') for f, v in zip(fields, values)}
+
+    def delete(self, job_id: str):
+        """Remove a job from the store."""
+        if self.redis is None:
+            with self._lock:
+                self._jobs.pop(job_id, None)
+                self._events.pop(job_id, None)
+            return
+
+        self.redis.delete(self._key(job_id), self._events_key(job_id))
+
+    def list_jobs(self, fields: List[str]) -> List[Dict[str, str]]:
+        """
+        List stored jobs.
+
+        Args:
+            fields: Fields to read for each job
+
+        Returns:
+            List of job field dictionaries
+        """
+        if self.redis is None:
+            with self._lock:
+                return [{f: job.get(f, '') for f in fields} for job in self._jobs.values()]
+
+        keys = list(self.redis.scan_iter(match=f"{self.KEY_PREFIX}*"))
+        if not keys:
+            return []
+
+        pipe = self.redis.pipeline()
+        for key in keys:
+            pipe.hmget(key, fields)
+
+        jobs = []
+        for values in pipe.execute():
+            if all(v is None for v in values):
+                continue  # Expired between SCAN and HMGET
+            jobs.append({f: (v if v is not None else '') for f, v in zip(fields, values)})
+        return jobs
@@ -0,0 +1,106 @@
+"""
+Adaptive concurrency limiter for YouTube downloads
+"""
+import re
+import random
+import threading
+import time
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Errors that mean YouTube is throttling us (silent 403s, 429s and bot challenges).
+# Status codes only count as HTTP statuses, not digits inside video IDs, URLs or sizes
+THROTTLE_RE = re.compile(
+    r"\bHTTP(?: Error)? (?:403|429)\b"
+    r"|\b(?:403 Forbidden|429 Too Many Requests)\b"
+    r"|Too Many Requests"
+    r"|Sign in to confirm"
+    r"|\brate.?limit",
+    re.I
+)
+
+def is_throttle_error(error: Optional[str]) -> bool:
+    """Check if a download error looks like YouTube rate limiting."""
+    return bool(error) and THROTTLE_RE.search(error) is not None
+
+class AdaptiveLimiter:
+    """
+    Concurrency limiter that shrinks on throttling errors and grows back on success.
+    Every throttled download drops one permit (down to 1) and is followed by an
+    exponential, jittered backoff; a streak of successes restores one permit and
+    resets the backoff.
+    """
+
+    def __init__(self,
+                 max_concurrency: int,
+                 backoff_base: float = 5.0,
+                 backoff_max: float = 300.0,
+                 recovery_successes: int = 10):
+        """
+        Initialize limiter.
+
+        Args:
+            max_concurrency: Maximum (and initial) number of concurrent downloads
+            backoff_base: First backoff delay in seconds
+            backoff_max: Maximum backoff delay in seconds
+            recovery_successes: Consecutive successes needed to restore one permit
+        """
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.recovery_successes = recovery_successes
+        self._backoff = backoff_base
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def report(self, error: Optional[str] = None) -> float:
+        """
+        Record the outcome of a download.
+
+        Args:
+            error: Error message of a failed download (None on success)
+
+        Returns:
+            Seconds the caller should sleep before its next download
+        """
+        with self._cond:
+            if not is_throttle_error(error):
+                self._successes += 1
+                if self._successes >= self.recovery_successes:
+                    self._successes = 0
+                    self._backoff = self.backoff_base
+                    if self.limit < self.max_concurrency:
+                        self.limit += 1
+                        logger.info(f"🔼 Download concurrency restored to {self.limit}")
+                        self._cond.notify_all()
+                return 0.0
+
+            self._successes = 0
+            if self.limit > 1:
+                self.limit -= 1
+            delay = random.uniform(self._backoff, self._backoff * 2)
+            self._backoff = min(self._backoff * 2, self.backoff_max)
+
+        logger.warning(f"🐢 YouTube throttling detected, concurrency {self.limit}, backing off {delay:.0f}s")
+        return delay
+
+    def backoff(self, error: Optional[str] = None):
+        """Record the outcome of a download and sleep if YouTube is throttling."""
+        delay = self.report(error)
+        if delay > 0:
+            time.sleep(delay)
@@ -3,20 +3,97 @@ Simplified YouTube Audio Download Pipeline
 Downloads YouTube videos/channels and saves to GCP bucket
 """
 import os
+import re
 import time
 import json
+import shutil
+import hashlib
+import tempfile
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import logging
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config import Config
 from .youtube_downloader import YouTubeDownloader
 from .youtube_scanner import YouTubeChannelScanner
 from .gcp_uploader import GCPUploader
+from .rate_limiter import AdaptiveLimiter
+from .info_cache import VideoInfoCache
 
 logger = logging.getLogger(__name__)
 
+def _dump_json(path: Path, obj: Any):
+    """Write an indented UTF-8 JSON file (orjson when installed, stdlib otherwise)."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False, default=str)
+
+def _json_line(obj: Any) -> bytes:
+    """Serialize an object to one NDJSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+
+_now_cache = (0, '')
+
+def _now_iso() -> str:
+    """Local time as an ISO 8601 string, formatted at most once per second."""
+    global _now_cache
+    now = int(time.time())
+    if _now_cache[0] != now:
+        _now_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now)))
+    return _now_cache[1]
+
+# Upper bound of FLAC 24kHz mono bytes per second of audio, used to size scratch downloads
+FLAC_BYTES_PER_SECOND = 64 * 1024
+
+# Scratch entries older than this were left by a crashed process
+SCRATCH_STALE_AGE = 86400
+
+# Channel/playlist URLs (same patterns as the web app's URL validation)
+_CHANNEL_RE = re.compile(r"/(?:channel/|c/|user/|@|playlist\?)", re.IGNORECASE)
+
+class _ThrottledCallback:
+    """Forward progress callbacks at most every min_interval seconds (first and last always pass)."""
+    
+    def __init__(self, callback, min_interval: float = 0.05):
+        self.callback = callback
+        self.min_interval = min_interval
+        self.last = 0.0
+    
+    def __call__(self, video_url: str, success: bool, total: int, current: int):
+        now = time.monotonic()
+        if current not in (1, total) and now - self.last < self.min_interval:
+            return
+        self.last = now
+        self.callback(video_url, success, total, current)
+
+# Channel scans are expensive in YouTube API quota, reuse them for a day
+SCAN_CACHE_TTL = 86400
+
+@lru_cache(maxsize=128)
+def _read_scan_cache(path: str, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is part of the key so a re-scanned channel is read again
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# GCS limit for the total size of an object's custom metadata
+BLOB_METADATA_LIMIT = 8 * 1024
+
+# Upper bound for per-channel parallel downloads (higher values trigger YouTube rate limits)
+MAX_PARALLEL_DOWNLOADS = 8
+
 class SimpleDownloadPipeline:
     """
     Simplified pipeline for YouTube audio download and GCP bucket storage:
@@ -31,30 +108,90 @@ class SimpleDownloadPipeline:
                  youtube_api_key: Optional[str] = None,
                  gcp_project_id: str = "GCP_PROJECT_ID",
                  gcp_bucket_name: str = "GCP_BUCKET_NAME",
-                 gcp_credentials_path: Optional[str] = None):
+                 gcp_credentials_path: Optional[str] = None,
+                 proxy: Optional[str] = None,
+                 parallel_downloads: Optional[int] = None):
         
         # Set up directories
         self.output_base_dir = output_base_dir or Config.OUTPUT_DIR
         Config.create_directories()
         
         # Initialize components
-        self.downloader = YouTubeDownloader()
+        self.downloader = YouTubeDownloader(proxy=proxy)
         self.youtube_scanner = YouTubeChannelScanner(
             api_key=youtube_api_key or Config.YOUTUBE_API_KEY or '',
             base_dir=self.output_base_dir / "youtube_scans"
         )
         
-        # Initialize GCP uploader
+        # Videos downloaded at the same time within a channel
+        self.parallel_downloads = max(1, min(parallel_downloads or Config.PARALLEL_DOWNLOADS, MAX_PARALLEL_DOWNLOADS))
+        
+        # Initialize GCP uploader (one client shared by every upload; two uploads in flight per video)
         self.gcp_uploader = GCPUploader(
             project_id=gcp_project_id,
             bucket_name=gcp_bucket_name,
-            credentials_path=gcp_credentials_path
+            credentials_path=gcp_credentials_path,
+            pool_size=max(64, self.parallel_downloads * 2)
         )
+        self._gcp_available = self.gcp_uploader.is_available()
+        
+        # Channel URL lists cached on disk (see SCAN_CACHE_TTL)
+        self.scan_cache_dir = self.output_base_dir / ".scan_cache"
+        self.scan_cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # yt-dlp info cached per video ID (re-runs and resumed channels skip the extraction)
+        self.info_cache = VideoInfoCache(self.output_base_dir / ".info_cache")
+        
+        # In-memory download dir for immediate uploads (None = download to session dir)
+        self.scratch_dir = self._resolve_scratch_dir()
         
         # Pipeline state
         self.current_session = None
         self.session_dir = None
+        self.current_target = None
+        self._gcs_audio_prefix = None
+        self._gcs_metadata_prefix = None
         
+    @staticmethod
+    def _resolve_scratch_dir() -> Optional[Path]:
+        """Return the RAM-backed scratch directory if enabled and available on this system."""
+        if not Config.STREAM_TO_GCP or not Config.SCRATCH_DIR.parent.is_dir():
+            return None
+        
+        try:
+            Config.SCRATCH_DIR.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"⚠️ Scratch dir not available, downloading to disk: {e}")
+            return None
+        
+        # tmpfs is never cleaned by the system, drop what crashed processes left behind
+        cutoff = time.time() - SCRATCH_STALE_AGE
+        with os.scandir(Config.SCRATCH_DIR) as it:
+            for entry in it:
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                        else:
+                            os.unlink(entry.path)
+                except OSError:
+                    pass
+        
+        return Config.SCRATCH_DIR
+    
+    def _scratch_fits(self, duration: Optional[float]) -> bool:
+        """Check that audio of this duration fits in the RAM-backed scratch dir, otherwise it goes to disk."""
+        max_size = Config.SCRATCH_MAX_FILE_MB * 1024 * 1024
+        if not duration or duration * FLAC_BYTES_PER_SECOND > max_size:
+            return False
+        
+        try:
+            free = shutil.disk_usage(self.scratch_dir).free
+        except OSError:
+            return False
+        # Leave room for a full-sized file from every parallel worker
+        return free >= max_size * self.parallel_downloads
+    
     def create_session(self, session_name: Optional[str] = None) -> Path:
         """Create a new download session directory."""
         if session_name is None:
@@ -62,6 +199,10 @@ class SimpleDownloadPipeline:
             session_name = f"download_session_{timestamp}"
         
         self.current_session = session_name
+        
+        # Bucket prefixes are fixed for the session, build them once
+        self._gcs_audio_prefix = f"youtube_downloads/{session_name}/downloads/"
+        self._gcs_metadata_prefix = f"youtube_downloads/{session_name}/metadata/"
         self.session_dir = self.output_base_dir / session_name
         self.session_dir.mkdir(parents=True, exist_ok=True)
         
@@ -90,20 +231,31 @@ class SimpleDownloadPipeline:
         if not self.session_dir:
             raise ValueError("No active session. Call create_session() first.")
         
+        scratch = None
         try:
-            # Set download directory to session downloads folder
-            self.downloader.output_dir = self.session_dir / 'downloads'
-            
             # Get video info first
-            video_info = self.downloader.get_video_info(url)
+            video_info = self.info_cache.get_or_fetch(url, self.downloader.get_video_info)
             video_title = video_info.get('title', 'Unknown')
             video_id = video_info.get('id', 'unknown')
             duration = video_info.get('duration', 0)
             
             logger.info(f"📹 Video: {video_title} (Duration: {duration}s)")
             
+            # Audio that is uploaded and deleted right away skips the session disk (RAM-backed scratch dir)
+            if (immediate_upload and self.scratch_dir is not None and self._gcp_available
+                    and self._scratch_fits(duration)):
+                # Private dir per download, so jobs fetching the same video never share files
+                scratch = Path(tempfile.mkdtemp(prefix=f"{video_id}_", dir=self.scratch_dir))
+            download_dir = scratch if scratch is not None else self.session_dir / 'downloads'
+            
             # Download audio
-            audio_path = self.downloader.download(url, custom_filename)
+            audio_path = self.downloader.download(url, custom_filename, output_dir=download_dir, info=video_info)
+            
+            # One stat for the size (0 if the file vanished)
+            try:
+                file_size = audio_path.stat().st_size
+            except OSError:
+                file_size = 0
             
             # Create metadata file
             metadata = {
@@ -111,14 +263,13 @@ class SimpleDownloadPipeline:
                 'title': video_title,
                 'url': url,
                 'duration': duration,
-                'download_time': datetime.now().isoformat(),
+                'download_time': _now_iso(),
                 'audio_file': str(audio_path.name),
-                'file_size': audio_path.stat().st_size if audio_path.exists() else 0
+                'file_size': file_size
             }
             
             metadata_file = self.session_dir / 'metadata' / f"{video_id}_metadata.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            _dump_json(metadata_file, metadata)
             
             result = {
                 'success': True,
@@ -134,33 +285,53 @@ class SimpleDownloadPipeline:
             }
             
             # Immediate upload to GCP if enabled and available
-            if immediate_upload and self.gcp_uploader.is_available():
+            if immediate_upload and self._gcp_available:
                 logger.info(f"⬆️ Uploading {video_title} to GCP...")
                 
                 # Upload audio file
                 session_name = self.current_session or "unknown_session"
-                audio_remote_path = f"youtube_downloads/{session_name}/downloads/{audio_path.name}"
+                audio_remote_path = self._gcs_audio_prefix + audio_path.name
+                
+                metadata_remote_path = self._gcs_metadata_prefix + metadata_file.name
+                
+                # Video metadata travels as custom metadata on the audio object when it fits
+                blob_metadata = {key: str(value) for key, value in metadata.items()}
+                blob_metadata.update(session_name=session_name, upload_time=_now_iso())
+                metadata_size = sum(len(k.encode('utf-8')) + len(v.encode('utf-8')) for k, v in blob_metadata.items())
                 
-                upload_result = self.gcp_uploader.upload_file(
-                    local_path=audio_path,
-                    remote_path=audio_remote_path,
-                    metadata={
-                        'video_id': video_id,
-                        'title': video_title,
-                        'duration': str(duration),
-                        'session_name': session_name,
-                        'upload_time': datetime.now().isoformat()
+                if metadata_size <= BLOB_METADATA_LIMIT:
+                    # One request per video, no separate metadata object
+                    upload_result = self.gcp_uploader.upload_file(
+                        local_path=audio_path,
+                        remote_path=audio_remote_path,
+                        metadata=blob_metadata
+                    )
+                    metadata_upload = {
+                        'success': upload_result.get('success', False),
+                        'public_url': upload_result.get('public_url')
                     }
-                )
+                    result['metadata_in_blob'] = True
+                else:
+                    # Metadata too large for the blob: separate JSON object, uploaded only once the audio is in
+                    upload_result = self.gcp_uploader.upload_file(
+                        local_path=audio_path,
+                        remote_path=audio_remote_path,
+                        metadata={
+                            'video_id': video_id,
+                            'title': video_title,
+                            'duration': str(duration),
+                            'session_name': session_name,
+                            'upload_time': _now_iso()
+                        }
+                    )
+                    metadata_upload = {'success': False}
+                    if upload_result.get('success', False):
+                        metadata_upload = self.gcp_uploader.upload_file(
+                            local_path=metadata_file,
+                            remote_path=metadata_remote_path
+                        )
                 
                 if upload_result.get('success', False):
-                    # Upload metadata file
-                    metadata_remote_path = f"youtube_downloads/{session_name}/metadata/{metadata_file.name}"
-                    metadata_upload = self.gcp_uploader.upload_file(
-                        local_path=metadata_file,
-                        remote_path=metadata_remote_path
-                    )
-                    
                     if metadata_upload.get('success', False):
                         logger.info(f"✅ Uploaded {video_title} to GCP successfully")
                         result['uploaded_to_gcp'] = True
@@ -169,13 +340,11 @@ class SimpleDownloadPipeline:
                         
                         # Clean up local files after successful upload
                         try:
-                            if audio_path.exists():
-                                audio_path.unlink()
-                                logger.info(f"🗑️ Cleaned up local audio: {audio_path.name}")
+                            audio_path.unlink(missing_ok=True)
+                            logger.info(f"🗑️ Cleaned up local audio: {audio_path.name}")
                             
-                            if metadata_file.exists():
-                                metadata_file.unlink()
-                                logger.info(f"🗑️ Cleaned up local metadata: {metadata_file.name}")
+                            metadata_file.unlink(missing_ok=True)
+                            logger.info(f"🗑️ Cleaned up local metadata: {metadata_file.name}")
                             
                             result['local_files_cleaned'] = True
                             
@@ -186,6 +355,14 @@ class SimpleDownloadPipeline:
                 else:
                     logger.warning(f"⚠️ Failed to upload audio for {video_title}: {upload_result.get('error')}")
             
+            # Upload did not complete: keep the audio in the session so a session upload can retry it
+            if scratch is not None and not result['local_files_cleaned']:
+                try:
+                    audio_path = Path(shutil.move(str(audio_path), str(self.session_dir / 'downloads' / audio_path.name)))
+                    result['audio_path'] = str(audio_path)
+                except FileNotFoundError:
+                    pass
+            
             return result
             
         except Exception as e:
@@ -195,125 +372,239 @@ class SimpleDownloadPipeline:
                 'url': url,
                 'error': str(e)
             }
+        
+        finally:
+            # Partial (.part) and unmoved files never outlive the download
+            if scratch is not None:
+                shutil.rmtree(scratch, ignore_errors=True)
     
-    def download_channel_videos(self, channel_url: str, max_videos: int = 2500, progress_callback=None) -> Dict[str, Any]:
+    def _download_limited(self, limiter: AdaptiveLimiter, url: str) -> Dict[str, Any]:
+        """Download a channel video under the adaptive limiter, backing off when YouTube throttles."""
+        with limiter:
+            result = self.download_single_video(url, immediate_upload=True)
+            # Sleep while still holding the slot so throttling really lowers concurrency
+            limiter.backoff(None if result['success'] else result.get('error'))
+        return result
+    
+    def _scan_channel_cached(self, channel_url: str, force_rescan: bool = False):
         """
-        Download all videos from a YouTube channel.
+        Scan a channel, reusing a scan of the same URL from the last SCAN_CACHE_TTL seconds.
         
         Args:
             channel_url: YouTube channel URL
-            max_videos: Maximum number of videos to download
-            progress_callback: Optional callback for progress updates
+            force_rescan: Ignore the cache and query the YouTube API again
             
         Returns:
-            Dictionary with download results
+            (video_list_path, video_urls) tuple, (None, []) if the scan failed
         """
-        logger.info(f"🔄 Downloading channel videos: {channel_url}")
+        cache_file = self.scan_cache_dir / f"{hashlib.sha1(channel_url.encode('utf-8')).hexdigest()}.json"
         
-        if not self.session_dir:
-            raise ValueError("No active session. Call create_session() first.")
+        if not force_rescan:
+            try:
+                stat = cache_file.stat()
+                if time.time() - stat.st_mtime < SCAN_CACHE_TTL:
+                    cached = _read_scan_cache(str(cache_file), stat.st_mtime_ns)
+                    logger.info(f"♻️ Using cached channel scan: {len(cached['video_urls'])} videos")
+                    return Path(cached['video_list_path']), list(cached['video_urls'])
+            except (OSError, ValueError, KeyError):
+                pass
         
-        try:
-            # Scan channel for video URLs
-            video_list_path = self.youtube_scanner.scan_channel(channel_url)
-            if not video_list_path:
-                return {
-                    'success': False,
-                    'error': 'Channel scan failed',
-                    'downloaded_count': 0,
-                    'failed_count': 0
-                }
-            
-            # Get video URLs
-            video_urls = self.youtube_scanner.get_video_urls(video_list_path)
-            if not video_urls:
-                return {
-                    'success': False,
-                    'error': 'No videos found in channel',
-                    'downloaded_count': 0,
-                    'failed_count': 0
-                }
-            
-            # Limit number of videos
-            if len(video_urls) > max_videos:
-                video_urls = video_urls[:max_videos]
-                logger.info(f"⚠️ Limited to first {max_videos} videos")
-            
-            # Download each video
-            downloaded_videos = []
-            failed_videos = []
+        video_list_path, video_urls = self.youtube_scanner.scan_channel(channel_url, return_urls=True)
+        
+        if video_list_path and video_urls:
+            try:
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.scan_cache_dir,
+                                                 suffix='.tmp', delete=False) as f:
+                    json.dump({
+                        'channel_url': channel_url,
+                        'video_list_path': str(video_list_path),
+                        'video_urls': video_urls
+                    }, f, ensure_ascii=False)
+                os.replace(f.name, cache_file)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not cache channel scan: {e}")
+        
+        return video_list_path, video_urls
+    
+    def _iter_video_results(self, video_urls: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Download videos in parallel and yield each result as it completes.
+        
+        Args:
+            video_urls: YouTube video URLs to download
             
-            for i, video_url in enumerate(video_urls):
+        Yields:
+            Per-video result dictionaries in completion order
+        """
+        # Concurrency adapts to YouTube throttling, up to parallel_downloads
+        limiter = AdaptiveLimiter(self.parallel_downloads)
+        
+        executor = ThreadPoolExecutor(max_workers=self.parallel_downloads)
+        futures = {
+            executor.submit(self._download_limited, limiter, video_url): video_url
+            for video_url in video_urls
+        }
+        try:
+            for future in as_completed(futures):
+                video_url = futures[future]
                 try:
-                    logger.info(f"📹 Downloading video {i+1}/{len(video_urls)}: {video_url}")
-                    
-                    # Download video with immediate upload
-                    result = self.download_single_video(video_url, immediate_upload=True)
-                    
-                    if result['success']:
-                        downloaded_videos.append(result)
-                        logger.info(f"✅ Downloaded: {result['title']}")
-                    else:
-                        failed_videos.append(result)
-                        logger.warning(f"❌ Failed: {video_url} - {result.get('error', 'Unknown error')}")
-                    
-                    # Update progress if callback provided
-                    if progress_callback:
-                        progress_callback(video_url, result['success'], len(video_urls), i+1)
-                        
+                    yield future.result()
                 except Exception as e:
                     logger.error(f"❌ Error downloading video {video_url}: {e}")
-                    failed_videos.append({
+                    yield {
                         'success': False,
                         'url': video_url,
                         'error': str(e)
-                    })
-                    
-                    if progress_callback:
-                        progress_callback(video_url, False, len(video_urls), i+1)
-            
-            # Create channel summary
-            channel_summary = {
-                'channel_url': channel_url,
-                'scan_time': datetime.now().isoformat(),
-                'total_videos_found': len(video_urls),
-                'downloaded_count': len(downloaded_videos),
-                'failed_count': len(failed_videos),
-                'downloaded_videos': downloaded_videos,
-                'failed_videos': failed_videos
-            }
-            
-            summary_file = self.session_dir / 'metadata' / 'channel_summary.json'
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(channel_summary, f, indent=2, ensure_ascii=False)
-            
-            # Create video list text file
-            video_list_file = self.session_dir / 'video_urls.txt'
-            with open(video_list_file, 'w', encoding='utf-8') as f:
-                f.write(f"Channel: {channel_url}\n")
-                f.write(f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total Videos: {len(video_urls)}\n")
-                f.write(f"Downloaded: {len(downloaded_videos)}\n")
-                f.write(f"Failed: {len(failed_videos)}\n")
-                f.write("\n=== DOWNLOADED VIDEOS ===\n")
-                for video in downloaded_videos:
-                    f.write(f"{video['url']} | {video['title']}\n")
-                f.write("\n=== FAILED VIDEOS ===\n")
-                for video in failed_videos:
-                    f.write(f"{video['url']} | Error: {video.get('error', 'Unknown')}\n")
+                    }
+        finally:
+            # Consumer stopped early (close() or an error): drop downloads that have not started yet
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            # The worker threads are gone, close the yt-dlp clients they created
+            self.downloader.close()
+    
+    def _iter_single_video(self, url: str, custom_filename: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Download a single video with immediate upload when the iterator is first advanced."""
+        yield self.download_single_video(url, custom_filename, immediate_upload=True)
+    
+    def _scan_channel_limited(self, channel_url: str, max_videos: int, force_rescan: bool = False) -> List[str]:
+        """
+        Scan a channel (cached for a day) and return at most max_videos URLs.
+        
+        Raises:
+            RuntimeError: If the scan fails or the channel has no videos
+        """
+        # Fresh scans write the list file in the background
+        video_list_path, video_urls = self._scan_channel_cached(channel_url, force_rescan)
+        if not video_list_path:
+            raise RuntimeError('Channel scan failed')
+        if not video_urls:
+            raise RuntimeError('No videos found in channel')
+        
+        if len(video_urls) > max_videos:
+            video_urls = video_urls[:max_videos]
+            logger.info(f"⚠️ Limited to first {max_videos} videos")
+        
+        return video_urls
+    
+    def _collect_channel_results(self,
+                                 channel_url: str,
+                                 total_videos: int,
+                                 results: Iterator[Dict[str, Any]],
+                                 progress_callback=None) -> Dict[str, Any]:
+        """
+        Consume per-video channel results and write the session files.
+        
+        Full results are streamed to metadata/channel_results.ndjson; only
+        counters, list-file lines and failures stay in memory.
+        
+        Args:
+            channel_url: YouTube channel URL
+            total_videos: Number of videos being downloaded
+            results: Per-video results in completion order
+            progress_callback: Optional callback for progress updates
             
-            return {
-                'success': True,
-                'channel_url': channel_url,
-                'total_videos': len(video_urls),
-                'downloaded_count': len(downloaded_videos),
-                'failed_count': len(failed_videos),
-                'summary_file': str(summary_file),
-                'video_list_file': str(video_list_file),
-                'downloaded_videos': downloaded_videos,
-                'failed_videos': failed_videos
-            }
+        Returns:
+            Dictionary with download counters and file paths
+        """
+        downloaded_count = 0
+        uploaded_count = 0
+        downloaded_lines = []
+        failed_lines = []
+        failed_videos = []
+        
+        results_file = self.session_dir / 'metadata' / 'channel_results.ndjson'
+        
+        # Coalesce progress updates to ~20/s, the UI only needs the latest count
+        if progress_callback:
+            progress_callback = _ThrottledCallback(progress_callback)
+        
+        logger.info(f"📹 Downloading {total_videos} videos with {self.parallel_downloads} workers...")
+        with open(results_file, 'wb') as results_fp:
+            for completed, result in enumerate(results, 1):
+                results_fp.write(_json_line(result))
+                
+                if result['success']:
+                    downloaded_count += 1
+                    uploaded_count += result.get('uploaded_to_gcp', False)
+                    downloaded_lines.append(f"{result['url']} | {result['title']}\n")
+                    logger.info(f"✅ Downloaded ({completed}/{total_videos}): {result['title']}")
+                else:
+                    failed_videos.append(result)
+                    failed_lines.append(f"{result['url']} | Error: {result.get('error', 'Unknown')}\n")
+                    logger.warning(f"❌ Failed: {result['url']} - {result.get('error', 'Unknown error')}")
+                
+                # Update progress if callback provided
+                if progress_callback:
+                    progress_callback(result['url'], result['success'], total_videos, completed)
+        
+        # Create channel summary (per-video results live in channel_results.ndjson)
+        channel_summary = {
+            'channel_url': channel_url,
+            'scan_time': _now_iso(),
+            'total_videos_found': total_videos,
+            'downloaded_count': downloaded_count,
+            'uploaded_count': uploaded_count,
+            'failed_count': len(failed_videos),
+            'results_file': results_file.name
+        }
+        
+        summary_file = self.session_dir / 'metadata' / 'channel_summary.json'
+        _dump_json(summary_file, channel_summary)
+        
+        # Create video list text file
+        video_list_file = self.session_dir / 'video_urls.txt'
+        with open(video_list_file, 'w', encoding='utf-8') as f:
+            f.write(f"Channel: {channel_url}\n")
+            f.write(f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Total Videos: {total_videos}\n")
+            f.write(f"Downloaded: {downloaded_count}\n")
+            f.write(f"Failed: {len(failed_videos)}\n")
+            f.write("\n=== DOWNLOADED VIDEOS ===\n")
+            f.writelines(downloaded_lines)
+            f.write("\n=== FAILED VIDEOS ===\n")
+            f.writelines(failed_lines)
+        
+        return {
+            'success': True,
+            'channel_url': channel_url,
+            'total_videos': total_videos,
+            'downloaded_count': downloaded_count,
+            'uploaded_count': uploaded_count,
+            'failed_count': len(failed_videos),
+            'summary_file': str(summary_file),
+            'results_file': str(results_file),
+            'video_list_file': str(video_list_file),
+            'failed_videos': failed_videos
+        }
+    
+    def download_channel_videos(self,
+                                channel_url: str,
+                                max_videos: int = 2500,
+                                progress_callback=None,
+                                force_rescan: bool = False) -> Dict[str, Any]:
+        """
+        Download all videos from a YouTube channel into the active session.
+        
+        Args:
+            channel_url: YouTube channel URL
+            max_videos: Maximum number of videos to download
+            progress_callback: Optional callback for progress updates
+            force_rescan: Ignore a cached channel scan and query the YouTube API again
             
+        Returns:
+            Dictionary with download results
+        """
+        logger.info(f"🔄 Downloading channel videos: {channel_url}")
+        
+        if not self.session_dir:
+            raise ValueError("No active session. Call create_session() first.")
+        
+        try:
+            video_urls = self._scan_channel_limited(channel_url, max_videos, force_rescan)
+            return self._collect_channel_results(channel_url, len(video_urls),
+                                                 self._iter_video_results(video_urls), progress_callback)
         except Exception as e:
             logger.error(f"❌ Error downloading channel: {e}")
             return {
@@ -323,10 +614,50 @@ class SimpleDownloadPipeline:
                 'failed_count': 0
             }
     
+    def iter_process_url(self,
+                         url: str,
+                         custom_filename: Optional[str] = None,
+                         max_videos: int = 2500,
+                         force_rescan: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Process a YouTube URL (video or channel) lazily in a new session.
+        
+        The session is created, and a channel scanned, before this returns;
+        downloads run as the iterator is consumed and each per-video result
+        is yielded as soon as it finishes. Closing the iterator early cancels
+        the downloads that have not started. self.current_target describes
+        what is being processed ('type' and 'total_videos').
+        
+        Args:
+            url: YouTube URL (video or channel)
+            custom_filename: Optional custom filename for single videos
+            max_videos: Maximum videos to download from channels
+            force_rescan: Ignore a cached channel scan and query the YouTube API again
+            
+        Returns:
+            Iterator of per-video result dictionaries in completion order
+            
+        Raises:
+            RuntimeError: If a channel scan fails or finds no videos
+        """
+        self.create_session()
+        
+        if _CHANNEL_RE.search(url) is None:
+            self.current_target = {'type': 'video', 'url': url, 'total_videos': 1}
+            return self._iter_single_video(url, custom_filename)
+        
+        self.current_target = {'type': 'channel', 'url': url, 'total_videos': 0}
+        logger.info(f"🔄 Downloading channel videos: {url}")
+        video_urls = self._scan_channel_limited(url, max_videos, force_rescan)
+        self.current_target['total_videos'] = len(video_urls)
+        return self._iter_video_results(video_urls)
+    
     def process_url(self, url: str, custom_filename: Optional[str] = None, max_videos: int = 2500, progress_callback=None) -> Dict[str, Any]:
         """
         Process a YouTube URL (video or channel).
         
+        Consumes iter_process_url() and writes the session summary files.
+        
         Args:
             url: YouTube URL (video or channel)
             custom_filename: Optional custom filename for single videos
@@ -341,49 +672,35 @@ class SimpleDownloadPipeline:
         logger.info("=== STARTING SIMPLE DOWNLOAD PIPELINE ===")
         logger.info(f"URL: {url}")
         
+        self.current_target = None
         try:
-            # Create session
-            session_dir = self.create_session()
+            results = self.iter_process_url(url, custom_filename, max_videos)
+            target = self.current_target
             
-            # Determine if it's a channel or single video
-            is_channel = any(pattern in url.lower() for pattern in [
-                '/channel/', '/c/', '/user/', '/@', '/playlist?'
-            ])
-            
-            if is_channel:
-                # Process channel
-                result = self.download_channel_videos(url, max_videos, progress_callback)
-                result['type'] = 'channel'
+            if target['type'] == 'channel':
+                result = self._collect_channel_results(url, target['total_videos'], results, progress_callback)
             else:
-                # Process single video with immediate upload
-                result = self.download_single_video(url, custom_filename, immediate_upload=True)
-                result['type'] = 'video'
                 # Wrap single video result in channel-like structure for consistency
-                if result['success']:
-                    result.update({
-                        'downloaded_count': 1,
-                        'failed_count': 0,
-                        'total_videos': 1
-                    })
-                else:
-                    result.update({
-                        'downloaded_count': 0,
-                        'failed_count': 1,
-                        'total_videos': 1
-                    })
+                result = next(results)
+                downloaded = 1 if result['success'] else 0
+                result.update({
+                    'downloaded_count': downloaded,
+                    'failed_count': 1 - downloaded,
+                    'total_videos': 1
+                })
+            result['type'] = target['type']
             
             # Add session info
             processing_time = time.time() - start_time
             result.update({
                 'session_name': self.current_session,
-                'session_dir': str(session_dir),
+                'session_dir': str(self.session_dir),
                 'processing_time': processing_time
             })
             
             # Save session results
-            results_file = session_dir / 'download_results.json'
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False, default=str)
+            results_file = self.session_dir / 'download_results.json'
+            _dump_json(results_file, result)
             
             logger.info("=== DOWNLOAD PIPELINE COMPLETED ===")
             logger.info(f"Processing time: {processing_time:.2f}s")
@@ -396,11 +713,25 @@ class SimpleDownloadPipeline:
             return {
                 'success': False,
                 'error': str(e),
-                'type': 'unknown',
+                'type': self.current_target['type'] if self.current_target else 'unknown',
                 'downloaded_count': 0,
                 'failed_count': 0
             }
     
+    @staticmethod
+    def _scan_files(directory: Path, suffix: str, file_type: str) -> List[Dict[str, Any]]:
+        """List files with a suffix in one scandir pass (sizes come from the directory read)."""
+        try:
+            with os.scandir(directory) as entries:
+                return [{
+                    'path': entry.path,
+                    'name': entry.name,
+                    'size': entry.stat(follow_symlinks=False).st_size,
+                    'type': file_type
+                } for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+        except FileNotFoundError:
+            return []
+    
     def get_download_summary(self) -> Dict[str, Any]:
         """
         Get summary of all files ready for GCP upload.
@@ -411,41 +742,9 @@ class SimpleDownloadPipeline:
         if not self.session_dir:
             return {'error': 'No active session'}
         
-        downloads_dir = self.session_dir / 'downloads'
-        metadata_dir = self.session_dir / 'metadata'
-        
-        audio_files = []
-        metadata_files = []
-        
-        # Collect audio files
-        if downloads_dir.exists():
-            for audio_file in downloads_dir.glob('*.flac'):
-                audio_files.append({
-                    'path': str(audio_file),
-                    'name': audio_file.name,
-                    'size': audio_file.stat().st_size,
-                    'type': 'audio'
-                })
-        
-        # Collect metadata files
-        if metadata_dir.exists():
-            for meta_file in metadata_dir.glob('*.json'):
-                metadata_files.append({
-                    'path': str(meta_file),
-                    'name': meta_file.name,
-                    'size': meta_file.stat().st_size,
-                    'type': 'metadata'
-                })
-        
-        # Include text files
-        text_files = []
-        for txt_file in self.session_dir.glob('*.txt'):
-            text_files.append({
-                'path': str(txt_file),
-                'name': txt_file.name,
-                'size': txt_file.stat().st_size,
-                'type': 'text'
-            })
+        audio_files = self._scan_files(self.session_dir / 'downloads', '.flac', 'audio')
+        metadata_files = self._scan_files(self.session_dir / 'metadata', '.json', 'metadata')
+        text_files = self._scan_files(self.session_dir, '.txt', 'text')
         
         return {
             'session_dir': str(self.session_dir),
@@ -455,7 +754,7 @@ class SimpleDownloadPipeline:
             'total_files': len(audio_files) + len(metadata_files) + len(text_files),
             'total_audio_size': sum(f['size'] for f in audio_files),
             'ready_for_gcp_upload': True,
-            'gcp_available': self.gcp_uploader.is_available()
+            'gcp_available': self._gcp_available
         }
     
     def upload_to_gcp(self, upload_after_download: bool = True) -> Dict[str, Any]:
@@ -471,11 +770,10 @@ class SimpleDownloadPipeline:
         if not self.session_dir:
             return {'error': 'No active session'}
         
-        if not self.gcp_uploader.is_available():
+        if not self._gcp_available:
             return {
                 'success': False,
                 'error': 'GCP uploader not available. Check credentials and dependencies.',
-                'uploaded_files': [],
                 'failed_files': []
             }
         
@@ -485,7 +783,7 @@ class SimpleDownloadPipeline:
         upload_result = self.gcp_uploader.upload_session_files(
             session_dir=self.session_dir,
             session_name=self.current_session,
-            include_patterns=['*.flac', '*.json', '*.txt', '*.csv']
+            include_patterns=['*.flac', '*.json', '*.ndjson', '*.txt', '*.csv']
         )
         
         if upload_result['success']:
@@ -498,6 +796,27 @@ class SimpleDownloadPipeline:
         
         return upload_result
     
+    def refresh_gcp_availability(self) -> bool:
+        """
+        Re-create the GCP uploader (e.g. after credentials changed) and refresh the cached availability.
+        
+        Returns:
+            Whether GCP uploads are available
+        """
+        # Re-read credentials from disk, they may have been rotated or added since startup
+        GCPUploader.clear_credentials_cache()
+        
+        uploader = self.gcp_uploader
+        self.gcp_uploader = GCPUploader(
+            project_id=uploader.project_id,
+            bucket_name=uploader.bucket_name,
+            credentials_path=uploader.credentials_path,
+            max_workers=uploader.max_workers,
+            pool_size=uploader.pool_size
+        )
+        self._gcp_available = self.gcp_uploader.is_available()
+        return self._gcp_available
+    
     def get_gcp_bucket_info(self) -> Dict[str, Any]:
         """
         Get information about the GCP bucket.
@@ -4,12 +4,17 @@ Warning suppression configuration for YouTube downloader
 import warnings
 import logging
 
-# Suppress general warnings
+__all__ = []
+
+# Filters are installed once at import: warnings.catch_warnings() swaps the
+# process-global filter list and is not safe in the parallel download workers
+
+# Suppress general warnings (emitted once at import time by some dependencies)
 warnings.filterwarnings("ignore", message=".*pkg_resources is deprecated.*")
 
-# Suppress YouTube-dl/yt-dlp warnings
-warnings.filterwarnings("ignore", category=UserWarning, module="yt_dlp")
+# Suppress warnings raised from inside yt-dlp
+warnings.filterwarnings("ignore", module="yt_dlp")
 
 # Set logging level for specific modules
 logging.getLogger("yt_dlp").setLevel(logging.WARNING)
-logging.getLogger("googleapiclient").setLevel(logging.WARNING)
\ No newline at end of file
+logging.getLogger("googleapiclient").setLevel(logging.WARNING)
@@ -8,16 +8,24 @@ from typing import Optional, Dict, Any
 import logging
 import subprocess
 import sys
+import threading
 
 from .config import Config
+from . import warning_suppression  # Installs the yt-dlp warning filter on import
 
 logger = logging.getLogger(__name__)
 
 class YouTubeDownloader:
-    def __init__(self, output_dir: Optional[Path] = None):
+    def __init__(self, output_dir: Optional[Path] = None, proxy: Optional[str] = None):
         self.output_dir = output_dir or Config.TEMP_DIR
+        self.proxy = proxy
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # One info-extraction YoutubeDL per thread, so its HTTP handlers keep connections alive
+        self._local = threading.local()
+        self._info_ydls = []
+        self._info_ydls_lock = threading.Lock()
+        
         # Configure UTF-8 encoding for subprocesses
         self._setup_encoding()
     
@@ -61,9 +69,39 @@ class YouTubeDownloader:
         
         return filename
         
+    def _info_ydl(self) -> yt_dlp.YoutubeDL:
+        """Return this thread's reusable YoutubeDL for info extraction (instances are not thread-safe)."""
+        ydl = getattr(self._local, 'info_ydl', None)
+        if ydl is None:
+            opts = {
+                'quiet': True,
+                'encoding': 'utf-8',
+                'no_warnings': True
+            }
+            if self.proxy:
+                opts['proxy'] = self.proxy
+            ydl = yt_dlp.YoutubeDL(opts)
+            self._local.info_ydl = ydl
+            with self._info_ydls_lock:
+                self._info_ydls.append(ydl)
+        return ydl
+    
+    def close(self):
+        """
+        Close the per-thread info-extraction clients and their connections.
+        
+        Call once the threads that used this downloader are done (e.g. after a
+        download executor shuts down); clients are created again on demand.
+        """
+        with self._info_ydls_lock:
+            ydls, self._info_ydls = self._info_ydls, []
+        for ydl in ydls:
+            ydl.close()
+        self._local = threading.local()
+    
     def _get_ydl_opts(self, output_path: str) -> Dict[str, Any]:
         """Get yt-dlp options for highest quality audio download."""
-        return {
+        opts = {
             'format': Config.YOUTUBE_FORMAT,
             'outtmpl': output_path,
             'noplaylist': True,
@@ -87,31 +125,38 @@ class YouTubeDownloader:
             'no_warnings': True,
             'quiet': True,
         }
+        if self.proxy:
+            opts['proxy'] = self.proxy
+        return opts
     
-    def download(self, url: str, custom_filename: Optional[str] = None) -> Path:
+    def download(self,
+                 url: str,
+                 custom_filename: Optional[str] = None,
+                 output_dir: Optional[Path] = None,
+                 info: Optional[Dict[str, Any]] = None) -> Path:
         """
         Download audio from YouTube URL.
         
         Args:
             url: YouTube URL
             custom_filename: Custom filename (without extension)
+            output_dir: Directory for this download (default: self.output_dir)
+            info: Video info already fetched by the caller (skips a second extraction)
             
         Returns:
             Path to downloaded audio file
         """
+        # Per-call directory so concurrent downloads never share mutable state
+        output_dir = output_dir or self.output_dir
+        
         try:
-            # Get video info first with UTF-8 encoding
-            ydl_opts_info = {
-                'quiet': True,
-                'encoding': 'utf-8',
-                'no_warnings': True
-            }
+            if info is None:
+                # Get video info first with UTF-8 encoding
+                info = self._info_ydl().extract_info(url, download=False)
             
-            with yt_dlp.YoutubeDL(ydl_opts_info) as ydl:
-                info = ydl.extract_info(url, download=False)
-                video_title = info.get('title', 'unknown')
-                video_id = info.get('id', 'unknown')
-                duration = info.get('duration', 0)
+            video_title = info.get('title', 'unknown')
+            video_id = info.get('id', 'unknown')
+            duration = info.get('duration', 0)
                 
             logger.info(f"Video: {video_title} (Duration: {duration}s)")
             
@@ -123,7 +168,7 @@ class YouTubeDownloader:
                 filename = self._sanitize_filename(f"{video_id}_{video_title}")
                 filename = filename[:100]  # Limit length
                 
-            output_path = str(self.output_dir / f"{filename}.%(ext)s")
+            output_path = str(output_dir / f"{filename}.%(ext)s")
             
             # Download with options
             ydl_opts = self._get_ydl_opts(output_path)
@@ -143,13 +188,13 @@ class YouTubeDownloader:
                 ydl.download([url])
                 
             # Find the downloaded file
-            expected_file = self.output_dir / f"{filename}.{Config.AUDIO_FORMAT}"
+            expected_file = output_dir / f"{filename}.{Config.AUDIO_FORMAT}"
             if expected_file.exists():
                 logger.info(f"Downloaded: {expected_file}")
                 return expected_file
             else:
                 # Search for file with similar name
-                for file in self.output_dir.glob(f"{filename}.*"):
+                for file in output_dir.glob(f"{filename}.*"):
                     if file.suffix[1:] == Config.AUDIO_FORMAT:
                         logger.info(f"Found downloaded file: {file}")
                         return file
@@ -162,8 +207,7 @@ class YouTubeDownloader:
     
     def get_video_info(self, url: str) -> Dict[str, Any]:
         """Get video information without downloading."""
-        with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
-            return ydl.extract_info(url, download=False)
+        return self._info_ydl().extract_info(url, download=False)
 
 
 # Example usage
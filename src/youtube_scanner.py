@@ -5,10 +5,13 @@ Integrates with the original katube search.py for channel/playlist scanning
 import os
 import sys
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from urllib.parse import urlparse, parse_qs
 import re
+import tempfile
+import threading
 
 try:
     from googleapiclient.discovery import build
@@ -20,6 +23,12 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=64)
+def _read_url_list(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    # mtime_ns is part of the key so a re-scanned list is read again
+    with open(path, 'r', encoding='utf-8') as f:
+        return tuple(line.strip() for line in f if line.strip())
+
 class YouTubeChannelScanner:
     """
     YouTube channel/playlist scanner using the original katube search.py
@@ -121,27 +130,31 @@ class YouTubeChannelScanner:
             logger.error(f"❌ Error resolving channel ID: {e}")
             return None
     
-    def scan_channel(self, channel_url: str, output_filename: str = "youtube_videos.txt") -> Optional[Path]:
+    def scan_channel(self, channel_url: str, output_filename: str = "youtube_videos.txt", return_urls: bool = False):
         """
         Scan YouTube channel for all videos using YouTube Data API.
         
         Args:
             channel_url: YouTube channel URL
             output_filename: Output filename for video list
+            return_urls: Also return the URL list (the file is then written in the background)
             
         Returns:
-            Path to output file with video URLs or None if failed
+            Path to output file with video URLs or None if failed.
+            With return_urls, a (path, urls) tuple ((None, []) if failed)
         """
+        failed = (None, []) if return_urls else None
+        
         try:
             if not self.api_key or not YOUTUBE_API_AVAILABLE:
                 logger.error("❌ YouTube API key or YouTube API not available")
-                return None
+                return failed
             
             # Extract channel ID
             channel_id = self.extract_channel_id(channel_url)
             if not channel_id:
                 logger.error(f"❌ Could not extract channel ID from: {channel_url}")
-                return None
+                return failed
             
             logger.info(f"🔍 Scanning channel: {channel_id}")
             
@@ -160,7 +173,7 @@ class YouTubeChannelScanner:
             
             if not channel_response['items']:
                 logger.error(f"❌ Channel not found: {channel_id}")
-                return None
+                return failed
             
             uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
             
@@ -185,19 +198,34 @@ class YouTubeChannelScanner:
                 if not next_page_token:
                     break
             
-            # Save to file
-            output_path = self.base_dir / output_filename
-            with open(output_path, 'w', encoding='utf-8') as f:
-                for url in video_urls:
-                    f.write(f"{url}\n")
-            
+            # Per-channel path: concurrent scans of other channels never touch this file
+            output_path = channel_dir / output_filename
             logger.info(f"✅ Channel scan complete: {len(video_urls)} videos found")
-            logger.info(f"✅ Saved to: {output_path}")
+            
+            if return_urls:
+                # Caller already has the URLs, persist the list without blocking it
+                threading.Thread(target=self._write_url_list, args=(output_path, video_urls)).start()
+                return output_path, video_urls
+            
+            # Save to file
+            self._write_url_list(output_path, video_urls)
             return output_path
                 
         except Exception as e:
             logger.error(f"❌ Error scanning channel: {e}")
-            return None
+            return failed
+    
+    @staticmethod
+    def _write_url_list(output_path: Path, video_urls: List[str]):
+        """Write one video URL per line (atomically, readers never see a partial list)."""
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=output_path.parent,
+                                             suffix='.tmp', delete=False) as f:
+                f.write(''.join(f"{url}\n" for url in video_urls))
+            os.replace(f.name, output_path)
+            logger.info(f"✅ Saved to: {output_path}")
+        except OSError as e:
+            logger.error(f"❌ Error saving video list: {e}")
     
     def get_video_urls(self, video_list_path: Path) -> List[str]:
         """
@@ -214,8 +242,7 @@ class YouTubeChannelScanner:
                 logger.error(f"❌ Video list file not found: {video_list_path}")
                 return []
             
-            with open(video_list_path, 'r', encoding='utf-8') as f:
-                urls = [line.strip() for line in f if line.strip()]
+            urls = list(_read_url_list(str(video_list_path), video_list_path.stat().st_mtime_ns))
             
             logger.info(f"📋 Found {len(urls)} video URLs")
             return urls
@@ -0,0 +1,96 @@
+"""
+Tests for composite (parallel part) uploads of GCPUploader
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from google.resumable_media.requests import ResumableUpload
+
+from src import gcp_uploader
+from src.gcp_uploader import GCPUploader
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = b'{}'
+
+    def json(self):
+        return {}
+
+
+class _Transport:
+    """Accepts a resumable session in memory, like the GCS upload endpoint."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def request(self, method, url, data=None, headers=None, **kwargs):
+        if method == 'POST':
+            return _Response(200, {'location': 'https://upload.example/session'})
+
+        self.data.extend(data)
+        byte_range, total = headers['content-range'].split(' ')[1].split('/')
+        end = int(byte_range.split('-')[1])
+        if total != '*' and end + 1 == int(total):
+            return _Response(200)
+        return _Response(308, {'range': f'bytes=0-{end}'})
+
+
+class _Blob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.chunk_size = None
+        self.metadata = None
+        self.content_type = None
+
+    def upload_from_file(self, file_obj, size=None, content_type=None, **kwargs):
+        # Same resumable-media upload the SDK runs (it rejects streams not at position 0)
+        transport = _Transport()
+        upload = ResumableUpload('https://upload.example/init', self.chunk_size)
+        upload.initiate(transport, file_obj, {}, content_type, total_bytes=size)
+        while not upload.finished:
+            upload.transmit_next_chunk(transport)
+        self.bucket.objects[self.name] = bytes(transport.data)
+
+    def compose(self, sources):
+        self.bucket.objects[self.name] = b''.join(self.bucket.objects[s.name] for s in sources)
+
+    def delete(self):
+        self.bucket.objects.pop(self.name, None)
+
+
+class _Bucket:
+    def __init__(self):
+        self.objects = {}
+
+    def blob(self, name):
+        return _Blob(self, name)
+
+
+def test_large_file_is_uploaded_as_composed_parts(tmp_path, monkeypatch):
+    # Scale the thresholds down so a small file takes the composite path
+    monkeypatch.setattr(gcp_uploader, 'SMALL_FILE_LIMIT', 1024)
+    monkeypatch.setattr(gcp_uploader, 'SINGLE_SHOT_UPLOAD_LIMIT', 2048)
+    monkeypatch.setattr(gcp_uploader, 'COMPOSITE_UPLOAD_THRESHOLD', 4096)
+    monkeypatch.setattr(gcp_uploader, 'RESUMABLE_CHUNK_SIZE', 256 * 1024)
+
+    data = os.urandom(2 * 1024 * 1024 + 3)
+    local_path = tmp_path / 'long_video.flac'
+    local_path.write_bytes(data)
+
+    uploader = GCPUploader.__new__(GCPUploader)
+    uploader.client = object()
+    uploader.bucket = _Bucket()
+    uploader.bucket_name = 'test-bucket'
+
+    result = uploader.upload_file(local_path, 'session/audios/long_video.flac')
+
+    assert result['success'], result.get('error')
+    assert list(uploader.bucket.objects) == ['session/audios/long_video.flac']
+    assert uploader.bucket.objects['session/audios/long_video.flac'] == data
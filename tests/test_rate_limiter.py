@@ -0,0 +1,37 @@
+"""
+Tests for YouTube throttling detection
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.rate_limiter import is_throttle_error
+
+
+@pytest.mark.parametrize('error', [
+    'ERROR: unable to download video data: HTTP Error 403: Forbidden',
+    'ERROR: [youtube] abc: HTTP Error 429: Too Many Requests',
+    'Got HTTP 429 from server',
+    'Sign in to confirm you’re not a bot',
+    'Rate limit exceeded',
+    'server returned 403 Forbidden',
+])
+def test_throttle_errors_are_detected(error):
+    assert is_throttle_error(error)
+
+
+@pytest.mark.parametrize('error', [
+    None,
+    '',
+    'ERROR: [youtube] x4290abcdEF: Video unavailable',
+    'ERROR: https://www.youtube.com/watch?v=a403bcdefgh is private',
+    'Downloaded 14290 of 1403000 bytes, then the connection was reset',
+    'Postprocessing: ffmpeg exited with code 1 after 403 frames',
+    'HTTP Error 404: Not Found',
+    'Generation failed: accurate limits not met',
+])
+def test_other_errors_are_not_throttling(error):
+    assert not is_throttle_error(error)
@@ -0,0 +1,67 @@
+"""
+Tests for the lazy per-video results of SimpleDownloadPipeline
+"""
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.simple_pipeline import SimpleDownloadPipeline
+
+
+class _Downloader:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _make_pipeline(started, release):
+    pipeline = SimpleDownloadPipeline.__new__(SimpleDownloadPipeline)
+    pipeline.parallel_downloads = 1
+    pipeline.downloader = _Downloader()
+
+    def download_limited(limiter, url):
+        started.append(url)
+        if url != 'video-1':
+            release.wait(timeout=5)
+        return {'success': True, 'url': url, 'title': url}
+
+    pipeline._download_limited = download_limited
+    return pipeline
+
+
+def test_closing_results_cancels_pending_downloads():
+    started = []
+    release = threading.Event()
+    pipeline = _make_pipeline(started, release)
+    urls = [f'video-{i}' for i in range(1, 6)]
+
+    results = pipeline._iter_video_results(urls)
+    first = next(results)
+    assert first['url'] == 'video-1'
+
+    # Let a download that already started finish while close() waits for it
+    threading.Timer(0.2, release.set).start()
+    results.close()
+
+    # One worker: at most the download after video-1 had started, the rest were cancelled
+    assert started[0] == 'video-1'
+    assert len(started) <= 2
+    assert pipeline.downloader.closed
+
+
+def test_results_are_yielded_as_downloads_finish():
+    started = []
+    release = threading.Event()
+    release.set()
+    pipeline = _make_pipeline(started, release)
+    urls = [f'video-{i}' for i in range(1, 4)]
+
+    results = list(pipeline._iter_video_results(urls))
+
+    assert sorted(r['url'] for r in results) == urls
+    assert all(r['success'] for r in results)
+    assert pipeline.downloader.closed